@@ -25,7 +25,7 @@ from agent import LoopData
 from python.helpers.extension import Extension
 
 PLAN_LIBRARY_PATH = Path(__file__).parent / "htn_plan_library.json"
-HTN_STATE_KEY = "_htn_state"
+HTN_STATE_KEY = "_htn_state"  # accessed directly as agent._htn_state below
 BST_STORE_KEY = "_bst_store"
 BST_BELIEF_KEY = "__bst_belief_state__"
 PACE_LEVEL_KEY = "_org_pace_level"
@@ -36,6 +36,9 @@ MAX_EVENTS = 50
 # Maximum auto-route depth (prevents infinite loops through decision chains)
 MAX_ROUTE_DEPTH = 15
 
+# Rendered linear-plan context cache cap (entries, shared across agents)
+MAX_CONTEXT_CACHE = 256
+
 
 class HTNPlanSelector(Extension):
     """Graph workflow engine with linear plan backward compatibility."""
@@ -178,21 +181,23 @@ def _match_plan(library: dict, domain: str, message: str, agent=None) -> tuple:
 
 # ── State Management ─────────────────────────────────────────────
 
+# The state lives in a plain agent._htn_state attribute. It is created as
+# None on first read and cleared back to None (never deleted), so every
+# later turn is a direct attribute load. Readers elsewhere use
+# getattr(agent, "_htn_state", None) and treat None as "no active plan".
+
 def _get_state(agent) -> dict | None:
     try:
-        return getattr(agent, HTN_STATE_KEY, None)
-    except Exception:
+        return agent._htn_state
+    except AttributeError:
+        agent._htn_state = None
         return None
 
 def _set_state(agent, state: dict):
-    setattr(agent, HTN_STATE_KEY, state)
+    agent._htn_state = state
 
 def _clear_state(agent):
-    try:
-        if hasattr(agent, HTN_STATE_KEY):
-            delattr(agent, HTN_STATE_KEY)
-    except Exception:
-        pass
+    agent._htn_state = None
 
 
 # ── Graph State Creation ────────────────────────────────────────
@@ -735,12 +740,36 @@ def _check_linear_progress(agent, state: dict, loop_data: LoopData, library: dic
     _set_state(agent, state)
 
 
+# Content-addressed: the rendered string depends only on the (immutable,
+# cached) plan and the progress fields in the key, so any agent at the same
+# point in the same plan reuses it. On turns where the plan doesn't advance
+# — the common case — injection is a single dict lookup.
+_linear_context_cache: dict[tuple, str] = {}
+
+
 def _inject_linear_context(loop_data: LoopData, state: dict, library: dict):
     """Build and inject linear plan context string into extras_temporary."""
-    plan = library.get("plans", {}).get(state["plan_id"])
-    if not plan:
-        return
+    key = (
+        state["plan_id"],
+        state["current_step"],
+        frozenset(state.get("steps_completed", [])),
+        frozenset(state.get("steps_failed", [])),
+    )
+    context = _linear_context_cache.get(key)
+    if context is None:
+        plan = library.get("plans", {}).get(state["plan_id"])
+        if not plan:
+            return
+        context = _render_linear_context(state, plan)
+        if len(_linear_context_cache) >= MAX_CONTEXT_CACHE:
+            _linear_context_cache.clear()
+        _linear_context_cache[key] = context
 
+    loop_data.extras_temporary["htn_active_plan"] = context
+
+
+def _render_linear_context(state: dict, plan: dict) -> str:
+    """Render the linear plan context string for the current progress."""
     lines = [f"[ACTIVE PLAN: {state['plan_name']}]"]
 
     for i, step in enumerate(plan.get("steps", [])):
@@ -767,4 +796,4 @@ def _inject_linear_context(loop_data: LoopData, state: dict, library: dict):
     lines.append("")
     lines.append(f"Execute Step {state['current_step'] + 1} now. Do not skip ahead. Verify before proceeding.")
 
-    loop_data.extras_temporary["htn_active_plan"] = "\n".join(lines)
+    return "\n".join(lines)
@@ -28,21 +28,27 @@ Entity types extracted (regex-first, no model calls):
 Storage: agent._working_memory dict with structure:
   {
     "entities": [
-      {"type": "file", "value": "/a0/agent.py", "turn": 12, "mentions": 3},
-      {"type": "ip",   "value": "192.168.1.1",  "turn": 10, "mentions": 1},
+      Entity(type="file", value="/a0/agent.py", turn=12, mentions=3),
+      Entity(type="ip",   value="192.168.1.1",  turn=10, mentions=1),
       ...
     ],
     "promoted": {
-      "/a0/agent.py": {"type": "file", "first_turn": 8, "last_turn": 12, "mentions": 5}
+      "/a0/agent.py": PromotedEntity(type="file", first_turn=8, last_turn=12, mentions=5)
     }
   }
 
+Entity records are slotted dataclasses rather than dicts — smaller and
+faster to access. Use dataclasses.asdict() where a plain dict is needed.
+
 Decay: Entities older than DECAY_TURNS are pruned each cycle.
 Promotion: Entities with >= PROMOTE_THRESHOLD mentions move to
            promoted dict and never decay during the session.
+Maintenance (decay, promotion, cap) runs at most every MAINT_INTERVAL
+turns, or immediately once the buffer exceeds MAX_ENTITIES.
 """
 
 import re
+from dataclasses import dataclass
 from typing import Any
 
 from python.helpers.extension import Extension
@@ -52,16 +58,23 @@ from python.helpers.extension import Extension
 DECAY_TURNS       = 8    # Prune entities not mentioned in this many turns
 PROMOTE_THRESHOLD = 3    # Mentions needed to promote to persistent memory
 MAX_ENTITIES      = 50   # Cap to prevent unbounded growth
-WM_KEY            = "_working_memory"
+MAINT_INTERVAL    = 4    # Turns between decay/promote/cap maintenance passes
+WM_KEY            = "_working_memory"  # accessed directly as agent._working_memory
 
 # ── Regex patterns for entity extraction ──────────────────────────────────────
+#
+# Every entity charset is ASCII-only, so all patterns compile with re.ASCII
+# (no Unicode property dispatch per character). Repeated groups are written
+# so that each iteration starts on a character the following token cannot
+# start with — flags always begin with "-", captured names never do — which
+# keeps matching linear instead of backtracking across loop iterations.
 
 # Absolute and home-relative paths
 _RE_PATH = re.compile(
-    r'(?:^|[\s`"\'])(/[a-zA-Z0-9_\-\.]+(?:/[a-zA-Z0-9_\-\.]+){1,15})'
+    r'(?:^|[\s`"\'])(/[a-zA-Z0-9_\-.]+(?:/[a-zA-Z0-9_\-.]+){1,15})'
     r'|'
-    r'(?:^|[\s`"\'])(~/[a-zA-Z0-9_\-\./]+)',
-    re.MULTILINE,
+    r'(?:^|[\s`"\'])(~/[a-zA-Z0-9_\-./]+)',
+    re.MULTILINE | re.ASCII,
 )
 
 # File names with extensions (backtick-quoted preferred, then bare)
@@ -69,63 +82,102 @@ _RE_FILE = re.compile(
     r'`([^`\s]+\.[a-zA-Z]{1,5})`'
     r'|'
     r'(?:^|[\s"\'])([a-zA-Z0-9_\-]+\.[a-zA-Z]{1,5})(?=[\s`"\',;:)\].]|$)',
-    re.MULTILINE,
+    re.MULTILINE | re.ASCII,
 )
 
 # URLs
 _RE_URL = re.compile(
     r'https?://[^\s<>"\')]+',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 # IPv4 addresses
 _RE_IP = re.compile(
-    r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b'
+    r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b',
+    re.ASCII,
 )
 
 # Port numbers — "port 8080", ":3000", "on port 443"
 _RE_PORT = re.compile(
     r'(?:port\s+|:)(\d{2,5})\b',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 # Container names — after docker keywords
 _RE_CONTAINER = re.compile(
     r'(?:container|docker\s+(?:exec|logs|stop|restart|rm|inspect|attach))\s+([a-zA-Z0-9_\-]+)',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
-# Docker image names — after docker run/pull/build
+# Docker image names — after docker run/pull/build (leading flags skipped)
 _RE_IMAGE = re.compile(
-    r'(?:docker\s+(?:run|pull|build|rmi|push))\s+(?:-[^\s]+\s+)*([a-zA-Z0-9_\-]+(?:/[a-zA-Z0-9_\-]+)*(?::[a-zA-Z0-9_\-\.]+)?)',
-    re.IGNORECASE,
+    r'docker\s+(?:run|pull|build|rmi|push)\s+(?:-\S+\s+)*'
+    r'([a-zA-Z0-9_][a-zA-Z0-9_\-]*(?:/[a-zA-Z0-9_\-]+)*(?::[a-zA-Z0-9_\-.]+)?)',
+    re.IGNORECASE | re.ASCII,
 )
 
 # Git branch names — after git checkout/branch/merge/rebase
 _RE_BRANCH = re.compile(
-    r'(?:checkout|branch|merge|rebase)\s+(?:-[^\s]+\s+)*([a-zA-Z0-9_\-/\.]+)',
-    re.IGNORECASE,
+    r'(?:checkout|branch|merge|rebase)\s+(?:-\S+\s+)*([a-zA-Z0-9_/.][a-zA-Z0-9_\-/.]*)',
+    re.IGNORECASE | re.ASCII,
 )
 
 # Package names — after pip install/uninstall, apt install
 _RE_PACKAGE = re.compile(
-    r'(?:pip\s+install|pip3\s+install|pip\s+uninstall|apt(?:-get)?\s+install)\s+(?:-[^\s]+\s+)*([a-zA-Z0-9_\-]+)',
-    re.IGNORECASE,
+    r'(?:pip3?\s+(?:install|uninstall)|apt(?:-get)?\s+install)\s+(?:-\S+\s+)*([a-zA-Z0-9_][a-zA-Z0-9_\-]*)',
+    re.IGNORECASE | re.ASCII,
 )
 
 # Config keys — key=value or key: value patterns in config context
 _RE_CONFIG_KEY = re.compile(
-    r'(?:set|change|update|modify)\s+(?:the\s+)?[`"\']?([a-zA-Z_][a-zA-Z0-9_\.\-]*)[`"\']?\s*(?:to|=)',
-    re.IGNORECASE,
+    r'(?:set|change|update|modify)\s+(?:the\s+)?[`"\']?([a-zA-Z_][a-zA-Z0-9_.\-]*)[`"\']?\s*(?:to|=)',
+    re.IGNORECASE | re.ASCII,
 )
 
 # Service/daemon names — systemctl, service commands
 _RE_SERVICE = re.compile(
     r'(?:systemctl|service)\s+(?:start|stop|restart|status|enable|disable)\s+([a-zA-Z0-9_\-]+)',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
+)
+
+# Cheap pre-check — every pattern above needs either a "/", ":" or "." in the
+# text, or one of its context keywords followed by whitespace. Each named
+# group is a trigger class; only patterns whose class was seen get run.
+# Messages with no trigger at all ("hi", "thanks", "ok") skip extraction.
+_GATE = re.compile(
+    r'(?P<slash>/)'
+    r'|(?P<colon>:)'
+    r'|(?P<dot>\.)'
+    r'|(?P<docker>(?:docker|container)\s)'
+    r'|(?P<git>(?:checkout|branch|merge|rebase)\s)'
+    r'|(?P<pkg>(?:pip3?|apt(?:-get)?)\s)'
+    r'|(?P<port>port\s)'
+    r'|(?P<svc>(?:systemctl|service)\s)'
+    r'|(?P<cfg>(?:set|change|update|modify)\s)',
+    re.IGNORECASE | re.ASCII,
 )
 
 
+# ── Entity records ────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class Entity:
+    """An active (decaying) working memory entity."""
+    type: str
+    value: str
+    turn: int
+    mentions: int = 1
+
+
+@dataclass(slots=True)
+class PromotedEntity:
+    """A promoted entity — keyed by value in wm["promoted"], never decays."""
+    type: str
+    first_turn: int
+    last_turn: int
+    mentions: int
+
+
 class WorkingMemoryBuffer(Extension):
     """Agent-Zero extension: hist_add_before"""
 
@@ -166,14 +218,19 @@ class WorkingMemoryBuffer(Extension):
             for etype, value in new_entities:
                 self._upsert_entity(wm, etype, value, turn)
 
-            # Decay old entities
-            self._decay(wm, turn)
+            # Maintenance passes are slow-moving — amortize them across turns
+            if (turn - wm["_last_maint_turn"] >= MAINT_INTERVAL
+                    or len(wm["entities"]) > MAX_ENTITIES):
+                # Decay old entities
+                self._decay(wm, turn)
+
+                # Promote frequently mentioned entities
+                self._promote(wm)
 
-            # Promote frequently mentioned entities
-            self._promote(wm)
+                # Cap total entity count
+                self._cap_entities(wm)
 
-            # Cap total entity count
-            self._cap_entities(wm)
+                wm["_last_maint_turn"] = turn
 
             # Persist
             self.agent._working_memory = wm
@@ -207,13 +264,18 @@ class WorkingMemoryBuffer(Extension):
 
     def _get_wm(self) -> dict:
         """Get or initialize working memory structure."""
-        wm = getattr(self.agent, WM_KEY, None)
+        try:
+            wm = self.agent._working_memory
+        except AttributeError:
+            wm = None
         if not isinstance(wm, dict):
-            wm = {"entities": [], "promoted": {}}
+            wm = {"entities": [], "promoted": {}, "_last_maint_turn": 0}
         if "entities" not in wm:
             wm["entities"] = []
         if "promoted" not in wm:
             wm["promoted"] = {}
+        if "_last_maint_turn" not in wm:
+            wm["_last_maint_turn"] = 0
         return wm
 
     def _current_turn(self) -> int:
@@ -225,52 +287,45 @@ class WorkingMemoryBuffer(Extension):
     def _upsert_entity(self, wm: dict, etype: str, value: str, turn: int) -> None:
         """Insert or update an entity in working memory."""
         # Check promoted first — just update turn
-        if value in wm["promoted"]:
-            wm["promoted"][value]["last_turn"] = turn
-            wm["promoted"][value]["mentions"] += 1
+        promoted = wm["promoted"].get(value)
+        if promoted is not None:
+            promoted.last_turn = turn
+            promoted.mentions += 1
             return
 
         # Check existing entities
         for entity in wm["entities"]:
-            if entity["type"] == etype and entity["value"] == value:
-                entity["turn"] = turn
-                entity["mentions"] += 1
+            if entity.type == etype and entity.value == value:
+                entity.turn = turn
+                entity.mentions += 1
                 return
 
         # New entity
-        wm["entities"].append({
-            "type": etype,
-            "value": value,
-            "turn": turn,
-            "mentions": 1,
-        })
+        wm["entities"].append(Entity(etype, value, turn))
 
     def _decay(self, wm: dict, current_turn: int) -> None:
         """Remove entities that haven't been mentioned recently."""
         wm["entities"] = [
             e for e in wm["entities"]
-            if (current_turn - e["turn"]) <= DECAY_TURNS
+            if (current_turn - e.turn) <= DECAY_TURNS
         ]
 
     def _promote(self, wm: dict) -> None:
         """Move frequently mentioned entities to promoted (never-decay) store."""
         still_active = []
         for entity in wm["entities"]:
-            if entity["mentions"] >= PROMOTE_THRESHOLD:
-                value = entity["value"]
-                if value not in wm["promoted"]:
-                    wm["promoted"][value] = {
-                        "type": entity["type"],
-                        "first_turn": entity["turn"],
-                        "last_turn": entity["turn"],
-                        "mentions": entity["mentions"],
-                    }
-                else:
-                    wm["promoted"][value]["last_turn"] = entity["turn"]
-                    wm["promoted"][value]["mentions"] = max(
-                        wm["promoted"][value]["mentions"],
-                        entity["mentions"],
+            if entity.mentions >= PROMOTE_THRESHOLD:
+                promoted = wm["promoted"].get(entity.value)
+                if promoted is None:
+                    wm["promoted"][entity.value] = PromotedEntity(
+                        type=entity.type,
+                        first_turn=entity.turn,
+                        last_turn=entity.turn,
+                        mentions=entity.mentions,
                     )
+                else:
+                    promoted.last_turn = entity.turn
+                    promoted.mentions = max(promoted.mentions, entity.mentions)
             else:
                 still_active.append(entity)
         wm["entities"] = still_active
@@ -279,7 +334,7 @@ class WorkingMemoryBuffer(Extension):
         """Prevent unbounded growth by keeping only the most recent entities."""
         if len(wm["entities"]) > MAX_ENTITIES:
             # Sort by turn descending, keep most recent
-            wm["entities"].sort(key=lambda e: e["turn"], reverse=True)
+            wm["entities"].sort(key=lambda e: e.turn, reverse=True)
             wm["entities"] = wm["entities"][:MAX_ENTITIES]
 
 
@@ -289,6 +344,13 @@ def _extract_entities(text: str) -> list[tuple[str, str]]:
     Returns list of (entity_type, value) tuples.
     Order: more specific patterns first to avoid false positives.
     """
+    # Shortest possible entity is a bare port like ":80"
+    if len(text) < 3:
+        return []
+    triggers = {m.lastgroup for m in _GATE.finditer(text)}
+    if not triggers:
+        return []
+
     entities = []
     seen = set()
 
@@ -301,61 +363,72 @@ def _extract_entities(text: str) -> list[tuple[str, str]]:
             seen.add(key)
             entities.append(key)
 
+    has_slash = "slash" in triggers
+    has_colon = "colon" in triggers
+    has_dot   = "dot" in triggers
+
     # URLs (before paths — URLs contain paths)
-    for match in _RE_URL.finditer(text):
-        _add("url", match.group(0))
+    if has_slash and has_colon:
+        for match in _RE_URL.finditer(text):
+            _add("url", match.group(0))
 
     # IP addresses
-    for match in _RE_IP.finditer(text):
-        ip = match.group(1)
-        # Basic validation: each octet 0-255
-        octets = ip.split(".")
-        if all(0 <= int(o) <= 255 for o in octets):
-            _add("ip", ip)
+    if has_dot:
+        for match in _RE_IP.finditer(text):
+            ip = match.group(1)
+            # Basic validation: each octet 0-255
+            octets = ip.split(".")
+            if all(0 <= int(o) <= 255 for o in octets):
+                _add("ip", ip)
 
     # Paths (absolute and home-relative)
-    for match in _RE_PATH.finditer(text):
-        value = match.group(1) or match.group(2)
-        if value:
-            _add("path", value)
+    if has_slash:
+        for match in _RE_PATH.finditer(text):
+            value = match.group(1) or match.group(2)
+            if value:
+                _add("path", value)
 
     # File names
-    for match in _RE_FILE.finditer(text):
-        value = match.group(1) or match.group(2)
-        if value and not _RE_IP.fullmatch(value):
-            _add("file", value)
-
-    # Container names
-    for match in _RE_CONTAINER.finditer(text):
-        _add("container", match.group(1))
-
-    # Docker images
-    for match in _RE_IMAGE.finditer(text):
-        _add("image", match.group(1))
-
-    # Git branches
-    for match in _RE_BRANCH.finditer(text):
-        val = match.group(1)
-        # Filter out common false positives
-        if val not in ("-b", "-d", "-D", "--force"):
-            _add("branch", val)
+    if has_dot:
+        for match in _RE_FILE.finditer(text):
+            value = match.group(1) or match.group(2)
+            if value and not _RE_IP.fullmatch(value):
+                _add("file", value)
+
+    if "docker" in triggers:
+        # Container names
+        for match in _RE_CONTAINER.finditer(text):
+            _add("container", match.group(1))
+
+        # Docker images
+        for match in _RE_IMAGE.finditer(text):
+            _add("image", match.group(1))
+
+    # Git branches (flags like -b/-D/--force never reach the capture group)
+    if "git" in triggers:
+        for match in _RE_BRANCH.finditer(text):
+            _add("branch", match.group(1))
 
     # Package names
-    for match in _RE_PACKAGE.finditer(text):
-        _add("package", match.group(1))
+    if "pkg" in triggers:
+        for match in _RE_PACKAGE.finditer(text):
+            _add("package", match.group(1))
 
     # Port numbers
-    for match in _RE_PORT.finditer(text):
-        port = int(match.group(1))
-        if 1 <= port <= 65535:
-            _add("port", str(port))
+    if has_colon or "port" in triggers:
+        for match in _RE_PORT.finditer(text):
+            port = int(match.group(1))
+            if 1 <= port <= 65535:
+                _add("port", str(port))
 
     # Config keys
-    for match in _RE_CONFIG_KEY.finditer(text):
-        _add("config_key", match.group(1))
+    if "cfg" in triggers:
+        for match in _RE_CONFIG_KEY.finditer(text):
+            _add("config_key", match.group(1))
 
     # Service names
-    for match in _RE_SERVICE.finditer(text):
-        _add("service", match.group(1))
+    if "svc" in triggers:
+        for match in _RE_SERVICE.finditer(text):
+            _add("service", match.group(1))
 
     return entities
@@ -11,25 +11,37 @@ Runs in the finally block of every message loop iteration, after history
 organization (_10_). Read-only on all state except history injection.
 
 Requires active organization — returns immediately when org kernel is off.
+Set EXO_SUPERVISOR=off to disable permanently: execute is swapped for a
+bare no-op at import time.
 """
 
-from typing import Any
+import os
+import sys
+from typing import Any, NamedTuple
 
-from agent import LoopData
+from agent import Agent, LoopData
 from python.helpers.extension import Extension
 
 # ── Constants ────────────────────────────────────────────────────
 
 # Agent attribute keys (verified from _12_org_dispatcher.py)
-ACTIVE_ROLE_KEY = "_org_active_role"
+# Interned: probed via agent.__dict__ on every iteration
+ACTIVE_ROLE_KEY = sys.intern("_org_active_role")
 PACE_LEVEL_KEY = "_org_pace_level"
 HTN_STATE_KEY = "_htn_state"
 TOOL_FAILURES_KEY = "_tool_failures"
 BST_STORE_KEY = "_bst_store"
 BST_BELIEF_KEY = "__bst_belief_state__"
+_CTX_WINDOW_KEY = Agent.DATA_NAME_CTX_WINDOW
 
-# Supervisor's own state key
-SUPERVISOR_STATE_KEY = "_supervisor_state"
+# Shared read-only fallback for missing dict data — avoids allocating per read
+_EMPTY: dict = {}
+
+# Environment switch — "off" installs the extension as a no-op
+SUPERVISOR_ENV = "EXO_SUPERVISOR"
+
+# Supervisor's own state key (interned: read from agent.__dict__ every iteration)
+SUPERVISOR_STATE_KEY = sys.intern("_supervisor_state")
 
 # Default check interval (every N iterations)
 DEFAULT_CHECK_INTERVAL = 3
@@ -37,8 +49,12 @@ DEFAULT_CHECK_INTERVAL = 3
 # Cooldown: minimum turns between same-type steering injections
 DEFAULT_COOLDOWN = 3
 
+# Mirror info-level steering messages to the UI log. The history warning
+# already carries the message, so this is dropped under `python -O`.
+_SUP_DEBUG = __debug__
+
 # Context exhaustion threshold (90% only — watchdog already warns at 70%/85%)
-CONTEXT_CRITICAL_THRESHOLD = 0.90
+CONTEXT_CRITICAL_PCT = 90
 
 # Loop detection: minimum repetitions of same pattern
 LOOP_DETECTION_THRESHOLD = 3
@@ -47,75 +63,127 @@ LOOP_DETECTION_THRESHOLD = 3
 CASCADE_TOOL_COUNT = 3
 CASCADE_WINDOW = 5
 
-# Anomaly types for cooldown tracking
-ANOMALY_STALL = "stall"
-ANOMALY_LOOP = "loop"
-ANOMALY_CONTEXT = "context"
-ANOMALY_CASCADE = "cascade"
-ANOMALY_PACE = "pace"
+# History tail needed by the loop/cascade detectors (oscillation needs 4)
+FAILURE_TAIL = max(CASCADE_WINDOW, LOOP_DETECTION_THRESHOLD, 4)
+
+# ── Steering Messages ────────────────────────────────────────────
+# Static prose lives here; injectors only fill in the variable parts.
+
+_STALL_FMT = (
+    "[SUPERVISOR] You appear stalled{task_info} — "
+    "no progress for {turns} turns. "
+    "Reassess your approach: try a different method, simplify the task, or ask the user for guidance."
+)
+_STALL_PLAN_FMT = " on plan '{plan}' (step {step}/{total})"
+_STALL_DOMAIN_FMT = " in domain '{domain}'"
+
+_LOOP_MSG = (
+    "[SUPERVISOR] You are repeating the same failing action. "
+    "Stop and try a fundamentally different approach — different tool, different path, or different strategy."
+)
+
+_CONTEXT_FMT = (
+    "[SUPERVISOR] Context window is {pct}% full. "
+    "Complete your immediate task and respond to the user. Do not start new subtasks."
+)
+
+_CASCADE_MSG = (
+    "[SUPERVISOR] Multiple different tools are failing. "
+    "Stop executing and verify your assumptions: correct directory, correct file paths, correct environment state."
+)
+
+_PACE_HINT_FMT = " Role guidance: {desc}"
+_PACE_CONTINGENT_FMT = (
+    "[SUPERVISOR] PACE level is CONTINGENT — your current approach has failed repeatedly.{hint} "
+    "Try a fundamentally different method or ask the user for guidance."
+)
+_PACE_EMERGENCY_FMT = (
+    "[SUPERVISOR] PACE level is EMERGENCY — stop all work immediately.{hint} "
+    "Preserve any partial results and report what you've accomplished and where you're stuck."
+)
 
 
 class SupervisorLoop(Extension):
     """XO supervisory loop — anomaly detection and steering injection."""
 
-    async def execute(self, loop_data: LoopData = LoopData(), **kwargs) -> Any:
+    async def execute(self, loop_data: LoopData | None = None, **kwargs) -> Any:
+        # loop_data is accepted for the hook signature but never read
         try:
-            # Only run when an organization is active
-            role = getattr(self.agent, ACTIVE_ROLE_KEY, None)
+            # Only run when an organization is active. Plain instance-dict
+            # probe — no MRO walk or descriptor lookup on the no-org path.
+            role = self.agent.__dict__.get(ACTIVE_ROLE_KEY)
             if not role:
                 return  # No org — zero overhead passthrough
 
-            # Get or initialize supervisor state
+            # Check interval — run checks every N turns. The counter is a
+            # bare int on the agent so skipped turns never touch the state.
+            turn = getattr(self.agent, "_sup_turn", 0) + 1
+            self.agent._sup_turn = turn
+            if turn % DEFAULT_CHECK_INTERVAL:
+                return
+
+            # Get or initialize supervisor state (mutated in place)
             state = _get_state(self.agent)
-            state["turn"] = state.get("turn", 0) + 1
+            state.turn = turn
 
-            # Check interval — run checks every N turns
-            interval = DEFAULT_CHECK_INTERVAL
-            if state["turn"] % interval != 0:
-                _set_state(self.agent, state)
+            # Cheap probe first — idle turns never build the full context
+            probe = _quick_probe(self.agent)
+            if _is_quiet(probe):
                 return
 
             # Read operational context
-            ctx = _gather_context(self.agent, role)
+            ctx = _gather_context(self.agent, role, probe)
+
+            # Role is stable for the life of the org — re-derive only on change
+            if state.role is not role:
+                _cache_role(state, role)
+
+            # Cooldowns: each anomaly type keeps the turn of its last
+            # injection in a cd_* slot on the state
+            turn = state.turn
+
+            # Both history detectors need a minimum tail — check it before
+            # paying for their call frames
+            hist_len = len(ctx.failure_tools)
 
             # Run anomaly detectors (order: most severe first)
             injected = False
 
             # 1. PACE escalation response (emergency exempt from cooldown)
-            if ctx["pace_level"] == "emergency":
-                _inject_pace_emergency(self.agent, role, ctx, state)
+            if ctx.pace_level == "emergency":
+                _inject_pace_emergency(self.agent, ctx, state)
                 injected = True
-            elif ctx["pace_level"] == "contingent":
-                if _cooldown_ok(state, ANOMALY_PACE):
-                    _inject_pace_contingent(self.agent, role, ctx, state)
+            elif ctx.pace_level == "contingent":
+                if turn - state.cd_pace >= DEFAULT_COOLDOWN:
+                    _inject_pace_contingent(self.agent, ctx, state)
                     injected = True
 
             # 2. Cascade failure detection
-            if not injected and _cooldown_ok(state, ANOMALY_CASCADE):
+            if (not injected and hist_len >= CASCADE_TOOL_COUNT
+                    and turn - state.cd_cascade >= DEFAULT_COOLDOWN):
                 if _detect_cascade(ctx):
                     _inject_cascade(self.agent, state)
                     injected = True
 
             # 3. Context exhaustion (only 90%+ — watchdog handles 70%/85%)
-            if not injected and _cooldown_ok(state, ANOMALY_CONTEXT):
+            if not injected and turn - state.cd_context >= DEFAULT_COOLDOWN:
                 if _detect_context_exhaustion(self.agent, ctx):
                     _inject_context_warning(self.agent, ctx, state)
                     injected = True
 
             # 4. Stall detection
-            if not injected and _cooldown_ok(state, ANOMALY_STALL):
-                if _detect_stall(ctx, role):
+            if not injected and turn - state.cd_stall >= DEFAULT_COOLDOWN:
+                if _detect_stall(ctx, state):
                     _inject_stall(self.agent, ctx, role, state)
                     injected = True
 
             # 5. Loop detection
-            if not injected and _cooldown_ok(state, ANOMALY_LOOP):
+            if (not injected and hist_len >= LOOP_DETECTION_THRESHOLD
+                    and turn - state.cd_loop >= DEFAULT_COOLDOWN):
                 if _detect_loop(ctx):
                     _inject_loop(self.agent, state)
                     injected = True
 
-            _set_state(self.agent, state)
-
         except Exception as e:
             try:
                 self.agent.context.log.log(
@@ -128,240 +196,275 @@ class SupervisorLoop(Extension):
 
 # ── State Management ─────────────────────────────────────────────
 
-def _get_state(agent) -> dict:
-    try:
-        state = getattr(agent, SUPERVISOR_STATE_KEY, None)
-        if state is None:
-            state = {"turn": 0, "cooldowns": {}}
-        return state
-    except Exception:
-        return {"turn": 0, "cooldowns": {}}
-
+class _SupState:
+    """Per-agent supervisor state. Created once, then mutated in place."""
 
-def _set_state(agent, state: dict):
-    setattr(agent, SUPERVISOR_STATE_KEY, state)
+    __slots__ = (
+        "turn",
+        # Turn of the last injection per anomaly type
+        "cd_pace", "cd_cascade", "cd_context", "cd_stall", "cd_loop",
+        # Per-role doctrine values, refreshed when the active role changes
+        "role", "max_turns_no_progress", "pace_contingent_desc", "pace_emergency_desc",
+    )
 
+    def __init__(self):
+        self.turn = 0  # agent._sup_turn as of the last check
+        # Every anomaly type starts outside its cooldown
+        self.cd_pace = self.cd_cascade = self.cd_context = -DEFAULT_COOLDOWN
+        self.cd_stall = self.cd_loop = -DEFAULT_COOLDOWN
+        self.role = None
+        self.max_turns_no_progress = 12
+        self.pace_contingent_desc = ""
+        self.pace_emergency_desc = ""
 
-# ── Cooldown Management ─────────────────────────────────────────
 
-def _cooldown_ok(state: dict, anomaly_type: str) -> bool:
-    """Check if the cooldown period has elapsed for this anomaly type."""
-    cooldowns = state.get("cooldowns", {})
-    last_turn = cooldowns.get(anomaly_type, 0)
-    current_turn = state.get("turn", 0)
-    return (current_turn - last_turn) >= DEFAULT_COOLDOWN
+def _cache_role(state: _SupState, role: dict):
+    """Extract the doctrine values the detectors and injectors read."""
+    state.role = role
+    state.max_turns_no_progress = role.get("doctrine", {}).get("max_turns_without_progress", 12)
+    pace_plan = role.get("pace_plan", {})
+    state.pace_contingent_desc = pace_plan.get("contingent", {}).get("description", "")
+    state.pace_emergency_desc = pace_plan.get("emergency", {}).get("description", "")
 
 
-def _mark_cooldown(state: dict, anomaly_type: str):
-    """Record that we just injected a steering message for this anomaly type."""
-    if "cooldowns" not in state:
-        state["cooldowns"] = {}
-    state["cooldowns"][anomaly_type] = state.get("turn", 0)
+def _get_state(agent) -> _SupState:
+    state = agent.__dict__.get(SUPERVISOR_STATE_KEY)
+    if state is None:
+        state = _SupState()
+        agent.__dict__[SUPERVISOR_STATE_KEY] = state
+    return state
 
 
 # ── Context Gathering ───────────────────────────────────────────
 
-def _gather_context(agent, role: dict) -> dict:
-    """Read all operational state into a single dict. Defensive on every read."""
-    ctx = {
-        "pace_level": "primary",
-        "htn_state": None,
-        "turns_since_progress": 0,
-        "htn_plan_name": "",
-        "htn_current_step": 0,
-        "htn_total_steps": 0,
-        "bst_domain": "",
-        "tool_failures": None,
-        "failure_history": [],
-        "max_consecutive_failures": 0,
-        "context_fill": 0.0,
-    }
-
-    # PACE level
-    try:
-        ctx["pace_level"] = getattr(agent, PACE_LEVEL_KEY, "primary") or "primary"
-    except Exception:
-        pass
+def _quick_probe(agent) -> tuple:
+    """Cheap reads that decide whether any detector could fire.
 
-    # HTN state
-    try:
-        htn = getattr(agent, HTN_STATE_KEY, None)
-        if htn:
-            ctx["htn_state"] = htn
-            ctx["turns_since_progress"] = htn.get("turns_since_progress", 0)
-            ctx["htn_plan_name"] = htn.get("plan_name", "")
-            ctx["htn_current_step"] = htn.get("current_step", 0)
-            ctx["htn_total_steps"] = htn.get("total_steps", 0)
-    except Exception:
-        pass
+    Returns (pace_level, htn_state, tool_failures, context_fill_pct).
+    Attribute reads use getattr defaults and cannot raise; only the
+    agent.get_data calls are guarded.
+    """
+    pace_level = getattr(agent, PACE_LEVEL_KEY, "primary") or "primary"
+    htn = getattr(agent, HTN_STATE_KEY, None)
+    failures = _EMPTY
+    context_fill_pct = 0
 
-    # BST domain
     try:
-        store = getattr(agent, BST_STORE_KEY, {})
-        belief = store.get(BST_BELIEF_KEY, {})
-        ctx["bst_domain"] = belief.get("domain", "")
-    except Exception:
-        pass
+        get_data = agent.get_data  # bound once for the three reads below
 
-    # Tool failures
-    try:
-        failures = agent.get_data(TOOL_FAILURES_KEY) or {}
-        ctx["tool_failures"] = failures
-        ctx["failure_history"] = failures.get("history", [])
-        consecutive = failures.get("consecutive", {})
-        ctx["max_consecutive_failures"] = max(consecutive.values()) if consecutive else 0
-    except Exception:
-        pass
+        # Tool failures
+        failures = get_data(TOOL_FAILURES_KEY) or _EMPTY
 
-    # Context fill — read from agent's ctx_window data (same source as context watchdog)
-    try:
-        from agent import Agent
-        ctx_window = agent.get_data(Agent.DATA_NAME_CTX_WINDOW) or {}
+        # Context fill — read from agent's ctx_window data (same source as context watchdog)
+        ctx_window = get_data(_CTX_WINDOW_KEY) or _EMPTY
         tokens = ctx_window.get("tokens", 0)
-        window_size = agent.get_data("context_window_size") or 100000
+        window_size = get_data("context_window_size") or 100000
         if tokens and window_size:
-            ctx["context_fill"] = tokens / window_size
+            # Integer percent — no float division, no rounding later
+            context_fill_pct = (tokens * 100) // window_size
     except Exception:
         pass
 
-    return ctx
+    if not isinstance(failures, dict):
+        failures = _EMPTY
+
+    return pace_level, htn, failures, context_fill_pct
+
+
+def _is_quiet(probe: tuple) -> bool:
+    """True when no detector can fire: PACE not escalated, no active plan,
+    no failure history, and context below the critical threshold."""
+    pace_level, htn, failures, context_fill_pct = probe
+    if pace_level in ("emergency", "contingent") or htn:
+        return False
+    if context_fill_pct >= CONTEXT_CRITICAL_PCT:
+        return False
+    return not failures.get("history")
+
+
+class _Ctx(NamedTuple):
+    """Operational state read once per supervised check."""
+    pace_level: str
+    htn_state: dict | None
+    turns_since_progress: int
+    htn_plan_name: str
+    htn_current_step: int
+    htn_total_steps: int
+    bst_domain: str
+    failure_tools: list         # tool names of the recent failure tail, oldest first
+    failure_pairs: list         # (tool, error_type) of the same tail
+    context_fill_pct: int
+
+
+def _gather_context(agent, role: dict, probe: tuple) -> _Ctx:
+    """Read all operational state into a _Ctx. Defensive on every read."""
+    pace_level, htn, failures, context_fill_pct = probe
+
+    # HTN state
+    htn_state = None
+    turns_since_progress = 0
+    htn_plan_name = ""
+    htn_current_step = 0
+    htn_total_steps = 0
+    if isinstance(htn, dict) and htn:
+        htn_state = htn
+        turns_since_progress = htn.get("turns_since_progress", 0)
+        htn_plan_name = htn.get("plan_name", "")
+        htn_current_step = htn.get("current_step", 0)
+        htn_total_steps = htn.get("total_steps", 0)
+
+    # BST domain
+    bst_domain = ""
+    store = getattr(agent, BST_STORE_KEY, None)
+    if isinstance(store, dict):
+        belief = store.get(BST_BELIEF_KEY)
+        if isinstance(belief, dict):
+            bst_domain = belief.get("domain", "")
+
+    # Tool failures — history entries come from another layer, so the
+    # derivation is the one block that stays guarded
+    tools = []
+    pairs = []
+    try:
+        history = failures.get("history", [])
+        # Struct-of-arrays view of the recent tail, built once per check.
+        # Indexed directly so the (possibly long) history is never sliced.
+        n = len(history)
+        tail = range(max(0, n - FAILURE_TAIL), n)
+        tools = [history[i].get("tool", "") for i in tail]
+        errors = [history[i].get("error_type", "") for i in tail]
+        pairs = list(zip(tools, errors))
+    except Exception:
+        tools = []
+        pairs = []
+
+    return _Ctx(
+        pace_level, htn_state, turns_since_progress, htn_plan_name,
+        htn_current_step, htn_total_steps, bst_domain, tools, pairs,
+        context_fill_pct,
+    )
 
 
 # ── Anomaly Detection ───────────────────────────────────────────
 
-def _detect_stall(ctx: dict, role: dict) -> bool:
+def _detect_stall(ctx: _Ctx, state: _SupState) -> bool:
     """Detect if the agent is stalled (no progress for too long)."""
-    if not ctx["htn_state"]:
+    if not ctx.htn_state:
         return False
-    max_turns = role.get("doctrine", {}).get("max_turns_without_progress", 12)
-    return ctx["turns_since_progress"] >= max_turns
+    return ctx.turns_since_progress >= state.max_turns_no_progress
 
 
-def _detect_loop(ctx: dict) -> bool:
+def _detect_loop(ctx: _Ctx) -> bool:
     """Detect behavioral loops — same tool+error repeated 3+ times in recent history."""
-    history = ctx.get("failure_history", [])
-    if len(history) < LOOP_DETECTION_THRESHOLD:
+    pairs = ctx.failure_pairs  # (tool, error_type), oldest first
+    n = len(pairs)
+    if n < LOOP_DETECTION_THRESHOLD:
         return False
 
-    recent = history[-LOOP_DETECTION_THRESHOLD:]
-
     # Pattern 1: Same tool + same error type repeated
-    if len(recent) >= LOOP_DETECTION_THRESHOLD:
-        first = (recent[0].get("tool", ""), recent[0].get("error_type", ""))
-        if all(
-            (e.get("tool", ""), e.get("error_type", "")) == first
-            for e in recent
-        ):
-            return True
+    if pairs[-LOOP_DETECTION_THRESHOLD:] == [pairs[-1]] * LOOP_DETECTION_THRESHOLD:
+        return True
 
     # Pattern 2: Oscillation — A, B, A, B pattern
-    if len(history) >= 4:
-        last4 = history[-4:]
-        pair_a = (last4[0].get("tool", ""), last4[0].get("error_type", ""))
-        pair_b = (last4[1].get("tool", ""), last4[1].get("error_type", ""))
-        if pair_a != pair_b:
-            if (last4[2].get("tool", ""), last4[2].get("error_type", "")) == pair_a and \
-               (last4[3].get("tool", ""), last4[3].get("error_type", "")) == pair_b:
-                return True
+    return n >= 4 and pairs[-4] != pairs[-3] and pairs[-4:-2] == pairs[-2:]
 
-    return False
 
-
-def _detect_context_exhaustion(agent, ctx: dict) -> bool:
+def _detect_context_exhaustion(agent, ctx: _Ctx) -> bool:
     """Detect context exhaustion at 90%+ (watchdog already handles 70%/85%)."""
-    return ctx["context_fill"] >= CONTEXT_CRITICAL_THRESHOLD
+    return ctx.context_fill_pct >= CONTEXT_CRITICAL_PCT
 
 
-def _detect_cascade(ctx: dict) -> bool:
+def _detect_cascade(ctx: _Ctx) -> bool:
     """Detect cascade failure — 3+ different tools failing in the last 5 entries."""
-    history = ctx.get("failure_history", [])
-    if len(history) < CASCADE_TOOL_COUNT:
+    tools = ctx.failure_tools
+    n = len(tools)
+    if n < CASCADE_TOOL_COUNT:
         return False
 
-    recent = history[-CASCADE_WINDOW:]
-    distinct_tools = set(e.get("tool", "") for e in recent if e.get("tool"))
-    return len(distinct_tools) >= CASCADE_TOOL_COUNT
+    distinct_tools = set()
+    for i in range(max(0, n - CASCADE_WINDOW), n):
+        tool = tools[i]
+        if tool:
+            distinct_tools.add(tool)
+            if len(distinct_tools) >= CASCADE_TOOL_COUNT:
+                return True
+    return False
 
 
 # ── Steering Injection ──────────────────────────────────────────
 
-def _inject_stall(agent, ctx: dict, role: dict, state: dict):
+def _inject_stall(agent, ctx: _Ctx, role: dict, state: _SupState):
     """Inject stall warning with task-specific context."""
     task_info = ""
-    if ctx["htn_plan_name"]:
-        task_info = f" on plan '{ctx['htn_plan_name']}' (step {ctx['htn_current_step'] + 1}/{ctx['htn_total_steps']})"
-    elif ctx["bst_domain"]:
-        task_info = f" in domain '{ctx['bst_domain']}'"
-
-    msg = (
-        f"[SUPERVISOR] You appear stalled{task_info} — "
-        f"no progress for {ctx['turns_since_progress']} turns. "
-        f"Reassess your approach: try a different method, simplify the task, or ask the user for guidance."
-    )
-    _emit(agent, msg, ANOMALY_STALL, state)
+    if ctx.htn_plan_name:
+        task_info = _STALL_PLAN_FMT.format(
+            plan=ctx.htn_plan_name,
+            step=ctx.htn_current_step + 1,
+            total=ctx.htn_total_steps,
+        )
+    elif ctx.bst_domain:
+        task_info = _STALL_DOMAIN_FMT.format(domain=ctx.bst_domain)
 
+    msg = _STALL_FMT.format(task_info=task_info, turns=ctx.turns_since_progress)
+    _emit(agent, msg)
+    state.cd_stall = state.turn
 
-def _inject_loop(agent, state: dict):
+
+def _inject_loop(agent, state: _SupState):
     """Inject loop detection warning."""
-    msg = (
-        "[SUPERVISOR] You are repeating the same failing action. "
-        "Stop and try a fundamentally different approach — different tool, different path, or different strategy."
-    )
-    _emit(agent, msg, ANOMALY_LOOP, state)
+    _emit(agent, _LOOP_MSG)
+    state.cd_loop = state.turn
 
 
-def _inject_context_warning(agent, ctx: dict, state: dict):
+def _inject_context_warning(agent, ctx: _Ctx, state: _SupState):
     """Inject context exhaustion warning at 90%+."""
-    pct = round(ctx["context_fill"] * 100)
-    msg = (
-        f"[SUPERVISOR] Context window is {pct}% full. "
-        f"Complete your immediate task and respond to the user. Do not start new subtasks."
-    )
-    _emit(agent, msg, ANOMALY_CONTEXT, state)
+    _emit(agent, _CONTEXT_FMT.format(pct=ctx.context_fill_pct))
+    state.cd_context = state.turn
 
 
-def _inject_cascade(agent, state: dict):
+def _inject_cascade(agent, state: _SupState):
     """Inject cascade failure warning."""
-    msg = (
-        "[SUPERVISOR] Multiple different tools are failing. "
-        "Stop executing and verify your assumptions: correct directory, correct file paths, correct environment state."
-    )
-    _emit(agent, msg, ANOMALY_CASCADE, state)
+    _emit(agent, _CASCADE_MSG)
+    state.cd_cascade = state.turn
 
 
-def _inject_pace_contingent(agent, role: dict, ctx: dict, state: dict):
+def _inject_pace_contingent(agent, ctx: _Ctx, state: _SupState):
     """Inject PACE contingent-level guidance."""
-    pace_desc = role.get("pace_plan", {}).get("contingent", {}).get("description", "")
-    hint = f" Role guidance: {pace_desc}" if pace_desc else ""
-    msg = (
-        f"[SUPERVISOR] PACE level is CONTINGENT — your current approach has failed repeatedly.{hint} "
-        f"Try a fundamentally different method or ask the user for guidance."
-    )
-    _emit(agent, msg, ANOMALY_PACE, state)
+    pace_desc = state.pace_contingent_desc
+    hint = _PACE_HINT_FMT.format(desc=pace_desc) if pace_desc else ""
+    _emit(agent, _PACE_CONTINGENT_FMT.format(hint=hint))
+    state.cd_pace = state.turn
 
 
-def _inject_pace_emergency(agent, role: dict, ctx: dict, state: dict):
+def _inject_pace_emergency(agent, ctx: _Ctx, state: _SupState):
     """Inject PACE emergency-level guidance. Always fires (no cooldown)."""
-    pace_desc = role.get("pace_plan", {}).get("emergency", {}).get("description", "")
-    hint = f" Role guidance: {pace_desc}" if pace_desc else ""
-    msg = (
-        f"[SUPERVISOR] PACE level is EMERGENCY — stop all work immediately.{hint} "
-        f"Preserve any partial results and report what you've accomplished and where you're stuck."
-    )
+    pace_desc = state.pace_emergency_desc
+    hint = _PACE_HINT_FMT.format(desc=pace_desc) if pace_desc else ""
+    msg = _PACE_EMERGENCY_FMT.format(hint=hint)
     # Emergency is exempt from cooldown — always inject
     try:
         agent.hist_add_warning(msg)
         agent.context.log.log(type="warning", content=msg)
     except Exception:
         pass
-    _mark_cooldown(state, ANOMALY_PACE)
+    state.cd_pace = state.turn
 
 
-def _emit(agent, msg: str, anomaly_type: str, state: dict):
-    """Inject steering message and mark cooldown."""
+def _emit(agent, msg: str):
+    """Inject steering message. Callers mark their own cooldown slot."""
     try:
         agent.hist_add_warning(msg)
-        agent.context.log.log(type="info", content=msg)
+        if _SUP_DEBUG:
+            agent.context.log.log(type="info", content=msg)
     except Exception:
         pass
-    _mark_cooldown(state, anomaly_type)
+
+
+# ── Disabled Build ──────────────────────────────────────────────
+
+async def _noop_execute(self, loop_data: LoopData | None = None, **kwargs) -> Any:
+    return None
+
+
+if os.environ.get(SUPERVISOR_ENV, "").strip().lower() == "off":
+    SupervisorLoop.execute = _noop_execute
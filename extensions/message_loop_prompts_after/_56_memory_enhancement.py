@@ -5,15 +5,17 @@ Hook: message_loop_prompts_after
 Priority: _56 (runs AFTER _55_memory_relevance_filter)
 
 Six-stage retrieval pipeline per turn:
-  1. Query Expansion: 3 FAISS queries (original, keyword, domain-scoped),
-     merged by memory ID keeping highest similarity per document.
+  1. Query Expansion: 3 query variants (original, keyword, domain-scoped)
+     searched concurrently, merged by memory ID keeping highest
+     similarity per document.
   2. Temporal Decay: exponential recency blended with similarity; exempt
      memories (load_bearing, user_asserted, confirmed) bypass decay.
   3. Related Memory Boost: preliminary top-k checked for related IDs;
      linked memories in the broader pool receive a score boost.
   4. Top-K Selection: final cap from model profile or config.
   5. Access Tracking: access_count += 1, last_accessed = utcnow().
-  6. Co-Retrieval Logging: append to /a0/usr/memory/co_retrieval_log.json.
+  6. Co-Retrieval Logging: append one line to co_retrieval_log.jsonl;
+     periodically folded into /a0/usr/memory/co_retrieval_log.json.
 
 Formula:
   recency_score = exp(-decay_rate * age_in_hours)
@@ -27,13 +29,19 @@ Reads:
 Writes:
   - loop_data.extras_persistent["memories"], ["solutions"]
   - Document.metadata lineage (access_count, last_accessed)
-  - /a0/usr/memory/co_retrieval_log.json
+  - /a0/usr/memory/co_retrieval_log.jsonl (pending entries)
+  - /a0/usr/memory/co_retrieval_log.json (compacted entries)
 """
 
+import asyncio
+import atexit
+import heapq
 import json
 import math
+import operator
 import os
 import re
+import time
 from datetime import datetime, timezone
 from typing import Any
 
@@ -46,7 +54,11 @@ from python.helpers.memory import Memory
 CONFIG_PATH = "/a0/usr/memory/classification_config.json"
 PROFILE_DIR = "/a0/usr/model_profiles"
 CO_RETRIEVAL_LOG = "/a0/usr/memory/co_retrieval_log.json"
+CO_RETRIEVAL_PENDING = "/a0/usr/memory/co_retrieval_log.jsonl"
 MAX_CO_RETRIEVAL_ENTRIES = 500
+CO_RETRIEVAL_COMPACT_EVERY = 25   # appends between folds into the JSON log
+SAVE_INTERVAL = 10                # dirty turns between docstore saves
+SAVE_MAX_AGE_S = 30.0             # max seconds an access update stays unsaved
 
 DEFAULT_CONFIG = {
     "load_bearing_keywords": [
@@ -62,6 +74,7 @@ DEFAULT_QE_CONFIG = {
     "use_domain_scoping": True,
     "use_keyword_extraction": True,
     "max_keywords": 12,
+    "coalesce_areas": True,
 }
 
 DEFAULT_DECAY_CONFIG = {
@@ -82,23 +95,64 @@ DEFAULT_RELATED_CONFIG = {
     "rebuild_interval_cycles": 25,
 }
 
+# Memory areas per injection slot; the filters are the search pushdown form
+MEMORY_AREAS = frozenset({"main", "fragments", "ontology"})
+SOLUTION_AREAS = frozenset({"solutions"})
+MEMORY_AREA_FILTER = (
+    "area == 'main' or area == 'fragments' or area == 'ontology'"
+)
+SOLUTION_AREA_FILTER = "area == 'solutions'"
+
 # Metadata keys (must match _55_memory_classifier.py)
 CLS_KEY = "classification"
 LIN_KEY = "lineage"
 
+# Parsed recency timestamps: (doc_id, iso_string) -> posix_ts. Kept off
+# Document.metadata so it never reaches the saved docstore; cleared
+# wholesale once it reaches MAX_PARSED_TS_CACHE entries.
+MAX_PARSED_TS_CACHE = 8192
+_parsed_ts_cache: dict[tuple[str, str], float] = {}
+
+# Metadata key an earlier version cached parsed timestamps under; dropped
+# from documents as they are accessed so it leaves saved stores
+LEGACY_PARSED_TS_KEY = "_parsed_ts"
+
 # BST access keys (must match _11_belief_state_tracker.py)
 BST_STORE_KEY = "_bst_store"
 BST_BELIEF_KEY = "__bst_belief_state__"
 
+_LN2 = math.log(2)
+
+# Shared read-only default for metadata .get() lookups (never mutate)
+_EMPTY: dict = {}
+
 # Utility rank for sorting (higher = more important)
 _UTILITY_ORDER = {"load_bearing": 2, "tactical": 1, "archived": 0}
 
+# Ranking key for (doc, score, utility_rank, doc_id) rows: utility first, then score
+_RANK_KEY = operator.itemgetter(2, 1)
+
 # Role directory for domain overlap checks
 ROLES_DIR = "/a0/usr/organizations/roles"
 
+# Parsed JSON files keyed by path: path -> (st_mtime_ns, data)
+_JSON_CACHE: dict[str, tuple[int, dict]] = {}
+
+# Memory DBs with unsaved access updates, flushed at interpreter exit
+_DIRTY_DBS: dict[int, Any] = {}
+
+# Co-retrieval appends since the last compaction (None until the first one)
+_co_pending: int | None = None
+
+# Active profile path from the last PROFILE_DIR scan: (dir st_mtime_ns, path)
+_profile_path_cache: tuple[int, str] | None = None
+
+# Role bst_domains keyed by role name: role -> (profile dict, frozenset)
+_ROLE_DOMAINS: dict[str, tuple[dict, frozenset]] = {}
+
 # ── Stopwords for keyword extraction ─────────────────────────────────────────
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the", "a", "an", "is", "are", "was", "were", "be", "been",
     "being", "have", "has", "had", "do", "does", "did", "will",
     "would", "could", "should", "may", "might", "shall", "can",
@@ -109,7 +163,11 @@ STOPWORDS = {
     "but", "not", "no", "if", "then", "so", "just", "about",
     "up", "out", "how", "what", "when", "where", "who", "which",
     "there", "here", "all", "each", "some", "any", "into", "as",
-}
+})
+
+# Word tokens longer than two characters (the length filter lives in the
+# pattern so short tokens never reach Python)
+_KW_RE = re.compile(r"\w{3,}")
 
 
 class MemoryEnhancement(Extension):
@@ -123,6 +181,12 @@ class MemoryEnhancement(Extension):
             extras = loop_data.extras_persistent
             has_solutions = "solutions" in extras
 
+            # One clock reading per turn, shared by decay, access tracking
+            # and co-retrieval logging
+            now_dt = datetime.now(timezone.utc)
+            now_iso = now_dt.isoformat()
+            now_ts = now_dt.timestamp()
+
             config = _load_config()
             qe_config = config.get("query_expansion", DEFAULT_QE_CONFIG)
             decay_config = config.get("temporal_decay", DEFAULT_DECAY_CONFIG)
@@ -132,9 +196,12 @@ class MemoryEnhancement(Extension):
             if not db or not db.db:
                 return
 
-            all_docs = db.db.get_all_docs()
+            all_docs = _get_doc_map(db)
             if not all_docs:
                 return
+            # Live keys view: O(1) membership and C-level set intersection
+            # without copying the id set every turn
+            all_doc_ids = all_docs.keys()
 
             # ── Load thresholds ───────────────────────────────────────────
             max_injected = config.get("max_injected_memories", 8)
@@ -152,12 +219,7 @@ class MemoryEnhancement(Extension):
                     sim_threshold = prof_thresh
 
             # ── Role domains for filtering ────────────────────────────────
-            role = getattr(self.agent, "_org_active_role", None)
-            role_domains = []
-            if role:
-                role_domains = role.get("capabilities", {}).get(
-                    "bst_domains", []
-                )
+            role_domains = _get_role_domains(self.agent)
 
             # ── BST domain ────────────────────────────────────────────────
             bst_domain = _get_bst_domain(self.agent)
@@ -175,13 +237,26 @@ class MemoryEnhancement(Extension):
 
             all_injected_ids = []
 
+            # ── Shared Stage 1 for memories + solutions ───────────────────
+            # One unfiltered search split by area replaces a filtered
+            # search per slot; "coalesce_areas": false restores pushdown.
+            mem_pool = sol_pool = None
+            if has_solutions and qe_config.get("coalesce_areas", True):
+                try:
+                    mem_pool, sol_pool = await _coalesced_search(
+                        db, query, bst_domain, role_domains,
+                        sim_threshold, qe_config,
+                    )
+                except Exception as qe_err:
+                    print(f"[MEM-ENHANCE] Coalesced search error: {qe_err}", flush=True)
+
             # ── Process memories (main + fragments + ontology entities) ───
             try:
                 result = await _run_pipeline(
-                    db, all_docs, query, bst_domain, role_domains,
-                    sim_threshold, max_injected,
-                    "area == 'main' or area == 'fragments' or area == 'ontology'",
-                    qe_config, decay_config, related_config,
+                    db, all_docs, all_doc_ids, query, bst_domain, role_domains,
+                    sim_threshold, max_injected, MEMORY_AREA_FILTER,
+                    qe_config, decay_config, related_config, now_ts,
+                    merged=mem_pool,
                 )
 
                 if result:
@@ -198,7 +273,7 @@ class MemoryEnhancement(Extension):
                             f"# Recalled Memories\n\n{txt}"
                         )
 
-                    ids = _update_access(result, all_docs)
+                    ids = _update_access(result, all_docs, now_iso, now_ts)
                     all_injected_ids.extend(ids)
                     print(f"[MEM-ENHANCE] Final selection: {len(ids)} memories injected", flush=True)
                 else:
@@ -212,10 +287,10 @@ class MemoryEnhancement(Extension):
                 try:
                     sol_cap = max(2, max_injected // 2)
                     result = await _run_pipeline(
-                        db, all_docs, query, bst_domain, role_domains,
-                        sim_threshold, sol_cap,
-                        "area == 'solutions'",
-                        qe_config, decay_config, related_config,
+                        db, all_docs, all_doc_ids, query, bst_domain, role_domains,
+                        sim_threshold, sol_cap, SOLUTION_AREA_FILTER,
+                        qe_config, decay_config, related_config, now_ts,
+                        merged=sol_pool,
                     )
 
                     if result:
@@ -232,24 +307,23 @@ class MemoryEnhancement(Extension):
                                 f"# Recalled Solutions\n\n{txt}"
                             )
 
-                        ids = _update_access(result, all_docs)
+                        ids = _update_access(
+                            result, all_docs, now_iso, now_ts,
+                        )
                         all_injected_ids.extend(ids)
                     else:
                         del extras["solutions"]
                 except Exception:
                     pass
 
-            # ── Persist access updates ────────────────────────────────────
+            # ── Persist access updates (batched across turns) ─────────────
             if all_injected_ids:
-                try:
-                    db._save_db()
-                except Exception:
-                    pass
+                _persist_access(self.agent, db, bst_domain)
 
             # ── Co-retrieval logging ──────────────────────────────────────
             if all_injected_ids:
                 _log_co_retrieval(
-                    all_injected_ids, bst_domain, maint_cycle,
+                    all_injected_ids, bst_domain, maint_cycle, now_iso,
                 )
                 print("[MEM-ENHANCE] Co-retrieval logged", flush=True)
 
@@ -263,28 +337,54 @@ class MemoryEnhancement(Extension):
                 pass
 
 
+# ── Docstore Access ──────────────────────────────────────────────────────────
+
+def _get_doc_map(db) -> dict:
+    """Return the live id -> Document mapping of the memory docstore.
+
+    Uses the InMemoryDocstore's own dict when present, so no per-turn copy
+    is built; metadata edits (access tracking) land on the live store.
+    Falls back to get_all_docs() for other docstores.
+    """
+    docs = getattr(getattr(db.db, "docstore", None), "_dict", None)
+    if isinstance(docs, dict):
+        return docs
+    return db.db.get_all_docs()
+
+
 # ── Full Pipeline ────────────────────────────────────────────────────────────
 
 async def _run_pipeline(
-    db, all_docs, query, bst_domain, role_domains,
+    db, all_docs, all_doc_ids, query, bst_domain, role_domains,
     sim_threshold, max_injected, area_filter,
-    qe_config, decay_config, related_config,
+    qe_config, decay_config, related_config, now_ts,
+    merged: list[tuple] | None = None,
 ) -> list[tuple]:
     """Run the 4-stage scoring pipeline: expand -> decay -> boost -> select.
 
+    A precomputed Stage 1 pool (from _coalesced_search) may be passed as
+    merged, in which case area_filter is not used.
     Returns [(doc, final_score)] for injection.
     """
     # Stage 1: Query Expansion
-    merged = await _query_expansion_search(
-        db, query, bst_domain, sim_threshold, qe_config, area_filter,
-    )
+    if merged is None:
+        merged = await _query_expansion_search(
+            db, query, bst_domain, role_domains,
+            sim_threshold, qe_config, area_filter,
+        )
     print(f"[MEM-ENHANCE] Query expansion: {len(merged)} candidates from 3 queries", flush=True)
     if not merged:
         return []
 
-    # Stage 2: Filter + Temporal Decay
+    # Stage 2: Filter + Temporal Decay (boost headroom keeps every doc
+    # Stage 3 could still lift into the top-K)
+    boost_headroom = (
+        related_config.get("related_boost", 0.08)
+        if related_config.get("enabled", True) else 0.0
+    )
     scored = _filter_and_decay(
-        merged, all_docs, role_domains, decay_config,
+        merged, all_docs, decay_config, now_ts,
+        max_injected, boost_headroom,
     )
     print(f"[MEM-ENHANCE] After decay: {len(scored)} candidates", flush=True)
     if not scored:
@@ -292,85 +392,186 @@ async def _run_pipeline(
 
     # Stage 3: Related Memory Boost
     scored = _apply_related_boost(
-        scored, all_docs, max_injected, related_config,
+        scored, all_doc_ids, max_injected, related_config,
     )
 
     # Stage 4: Top-K Selection
-    return [(doc, score) for doc, score, _ in scored[:max_injected]]
+    return [(doc, score) for doc, score, _, _ in scored[:max_injected]]
 
 
 # ── Stage 1: Query Expansion ─────────────────────────────────────────────────
 
+async def _coalesced_search(
+    db, query, bst_domain, role_domains, threshold, qe_config,
+) -> tuple[list[tuple], list[tuple]]:
+    """Run Stage 1 once without an area filter and split by area.
+
+    The per-query limit is doubled to cover both slots.
+    Returns (memory_pool, solution_pool).
+    """
+    merged = await _query_expansion_search(
+        db, query, bst_domain, role_domains, threshold, qe_config, "",
+        limit_scale=2,
+    )
+    mem_pool, sol_pool = [], []
+    for item in merged:
+        area = item[0].metadata.get("area")
+        if area in MEMORY_AREAS:
+            mem_pool.append(item)
+        elif area in SOLUTION_AREAS:
+            sol_pool.append(item)
+    return mem_pool, sol_pool
+
+
 async def _query_expansion_search(
-    db, query, bst_domain, threshold, qe_config, area_filter,
+    db, query, bst_domain, role_domains, threshold, qe_config, area_filter,
+    limit_scale: int = 1,
 ) -> list[tuple]:
     """Run multi-variant FAISS queries and merge by memory ID.
 
+    Deprecated and role-irrelevant docs are dropped here (see _admissible)
+    so they never enter the merged pool.
     Returns [(doc, max_similarity_score)] with duplicates merged.
     """
+    overlap_memo = {}  # created_by_role -> overlaps current role (per call)
     if not qe_config.get("enabled", True):
         # Single query fallback
         results = await db.search_similarity_threshold(
-            query=query, limit=50, threshold=threshold,
+            query=query, limit=50 * limit_scale, threshold=threshold,
             filter=area_filter,
         )
-        return _unpack_results(results)
+        return _unpack_results(results, role_domains, overlap_memo)
 
-    k = qe_config.get("retrieval_k_per_variant", 8)
+    k = qe_config.get("retrieval_k_per_variant", 8) * limit_scale
     max_kw = qe_config.get("max_keywords", 12)
 
     # Generate query variants
     queries = [query]  # 1. original
+    use_kw = qe_config.get("use_keyword_extraction", True)
+    use_domain = qe_config.get("use_domain_scoping", True) and bst_domain
+    kw_query = extract_keywords(query, max_kw) if use_kw or use_domain else ""
 
-    if qe_config.get("use_keyword_extraction", True):
-        kw_query = extract_keywords(query, max_kw)
-        if kw_query and kw_query.strip() != query.lower().strip():
-            queries.append(kw_query)  # 2. keyword-only
+    if use_kw and kw_query and kw_query.strip() != query.lower().strip():
+        queries.append(kw_query)  # 2. keyword-only
 
-    if qe_config.get("use_domain_scoping", True) and bst_domain:
-        kw_for_domain = extract_keywords(query, max_kw) or query
-        domain_query = f"{bst_domain}: {kw_for_domain}"
+    if use_domain:
+        domain_query = f"{bst_domain}: {kw_query or query}"
         queries.append(domain_query)  # 3. domain-scoped
 
-    # Run searches and merge by memory ID, keeping highest score
-    merged = {}  # doc_id -> (doc, max_score)
-    for q in queries:
-        try:
-            results = await db.search_similarity_threshold(
-                query=q, limit=k, threshold=threshold,
-                filter=area_filter,
-            )
-        except Exception:
-            continue
+    queries = list(dict.fromkeys(queries))
+    if len(queries) == 1:
+        # Single effective variant: nothing to merge across queries
+        results = await db.search_similarity_threshold(
+            query=queries[0], limit=k, threshold=threshold,
+            filter=area_filter,
+        )
+        return _unpack_results(results, role_domains, overlap_memo)
 
+    # Search all variants at once, merge by memory ID keeping the
+    # highest score
+    merged = {}  # doc_id -> (doc, max_score)
+    rejected = set()
+    for results in await _batch_search(
+        db, queries, k, threshold, area_filter,
+    ):
         for item in results:
             doc, score = item if isinstance(item, tuple) else (item, 1.0)
             if not hasattr(doc, "metadata"):
                 continue
             doc_id = doc.metadata.get("id", "")
-            if not doc_id:
+            if not doc_id or doc_id in rejected:
                 continue
-            if doc_id not in merged or score > merged[doc_id][1]:
+            prev = merged.get(doc_id)
+            if prev is None:
+                if not _admissible(doc.metadata, role_domains, overlap_memo):
+                    rejected.add(doc_id)
+                    continue
+                merged[doc_id] = (doc, score)
+            elif score > prev[1]:
                 merged[doc_id] = (doc, score)
 
     return list(merged.values())
 
 
-def _unpack_results(results) -> list[tuple]:
-    """Unpack search results into [(doc, score)]."""
+async def _batch_search(
+    db, queries, limit, threshold, area_filter,
+) -> list[list]:
+    """Search all query variants at once. Returns one result list per query.
+
+    Prefers a native Memory batch API; otherwise the per-query searches
+    run concurrently. Every path goes through Memory, so results carry the
+    same score type as the single-query searches above.
+    """
+    batch_fn = getattr(db, "search_similarity_threshold_batch", None)
+    if batch_fn is not None:
+        return await batch_fn(
+            queries=queries, limit=limit, threshold=threshold,
+            filter=area_filter,
+        )
+
+    results = await asyncio.gather(
+        *(
+            db.search_similarity_threshold(
+                query=q, limit=limit, threshold=threshold, filter=area_filter,
+            )
+            for q in queries
+        ),
+        return_exceptions=True,
+    )
+    return [[] if isinstance(r, BaseException) else r for r in results]
+
+
+def _unpack_results(results, role_domains, overlap_memo) -> list[tuple]:
+    """Unpack search results into [(doc, score)], dropping inadmissible docs."""
     unpacked = []
     for item in results:
         doc, score = item if isinstance(item, tuple) else (item, 1.0)
-        if hasattr(doc, "metadata"):
+        if hasattr(doc, "metadata") and _admissible(
+            doc.metadata, role_domains, overlap_memo,
+        ):
             unpacked.append((doc, score))
     return unpacked
 
 
+def _admissible(metadata: dict, role_domains, overlap_memo: dict) -> bool:
+    """Validity + role-relevance prefilter applied as results are merged.
+
+    Excludes deprecated memories and, under an active role, memories from
+    another domain (load_bearing is always kept). overlap_memo caches the
+    per-creating-role answer for the current search.
+    """
+    cls = metadata.get(CLS_KEY, _EMPTY)
+    if cls.get("validity") == "deprecated":
+        return False
+    if not role_domains or cls.get("utility", "tactical") == "load_bearing":
+        return True
+
+    lin = metadata.get(LIN_KEY, _EMPTY)
+    mem_domain = lin.get("bst_domain", "")
+    if mem_domain:
+        return mem_domain in role_domains
+    created_by = lin.get("created_by_role")
+    if not created_by:
+        return True
+    overlaps = overlap_memo.get(created_by)
+    if overlaps is None:
+        overlaps = overlap_memo[created_by] = _role_domain_overlaps(
+            created_by, role_domains,
+        )
+    return overlaps
+
+
 def extract_keywords(text: str, max_keywords: int = 12) -> str:
     """Deterministic keyword extraction: remove stopwords, cap at N terms."""
-    words = re.findall(r"\b\w+\b", text.lower())
-    keywords = [w for w in words if w not in STOPWORDS and len(w) > 2]
-    return " ".join(keywords[:max_keywords])
+    if not text or max_keywords <= 0:
+        return ""
+    keywords = []
+    for w in _KW_RE.findall(text.lower()):
+        if w not in STOPWORDS:
+            keywords.append(w)
+            if len(keywords) >= max_keywords:
+                break
+    return " ".join(keywords)
 
 
 # ── Stage 2: Filter + Temporal Decay ─────────────────────────────────────────
@@ -378,67 +579,89 @@ def extract_keywords(text: str, max_keywords: int = 12) -> str:
 def _filter_and_decay(
     merged_pool: list[tuple],
     all_docs: dict,
-    role_domains: list,
     decay_config: dict,
+    now_ts: float,
+    max_injected: int = 0,
+    boost_headroom: float = 0.0,
 ) -> list[tuple]:
-    """Apply validity/role filters and temporal decay scoring.
-
-    Returns [(doc, blended_score, utility_rank)] sorted descending.
+    """Apply temporal decay scoring to the prefiltered Stage 1 pool.
+
+    With max_injected set, docs whose best case (recency 1.0 plus
+    boost_headroom) still ranks below the K-th best scored so far are
+    skipped before decay, since they cannot reach the final top-K.
+    Returns [(doc, blended_score, utility_rank, doc_id)] sorted
+    descending; doc_id is read once here so later stages never touch
+    metadata for it.
     """
     decay_enabled = decay_config.get("enabled", True)
     decay_weight = decay_config.get("decay_weight", 0.15)
+    sim_weight = 1 - decay_weight
+    exempt_utils = frozenset(decay_config.get("exempt_utilities", ()))
+    exempt_sources = frozenset(decay_config.get("exempt_sources", ()))
+    exempt_validities = frozenset(decay_config.get("exempt_validities", ()))
+    half_life = decay_config.get("half_life_hours", 168)
+    decay_rate = _LN2 / half_life if half_life > 0 else 0.0
+    min_score = decay_config.get("min_recency_score", 0.1)
     scored = []
 
-    for doc, sim_score in merged_pool:
-        cls = doc.metadata.get(CLS_KEY, {})
-        lin = doc.metadata.get(LIN_KEY, {})
-
-        # Validity filter: exclude deprecated
-        if cls.get("validity") == "deprecated":
-            continue
+    # Min-heap of (utility_rank, blended) for the best max_injected so far;
+    # visiting by similarity fills it with strong candidates early
+    floor = []
+    if max_injected > 0:
+        merged_pool = sorted(merged_pool, key=lambda x: x[1], reverse=True)
 
-        # Role-relevance filter
-        utility = cls.get("utility", "tactical")
-        if role_domains and utility != "load_bearing":
-            mem_domain = lin.get("bst_domain", "")
-            if mem_domain and mem_domain not in role_domains:
+    for doc, sim_score in merged_pool:
+        metadata = doc.metadata
+        cls = metadata.get(CLS_KEY, _EMPTY)
+        utility_rank = _UTILITY_ORDER.get(cls.get("utility", "tactical"), 0)
+
+        # Early cutoff
+        if max_injected > 0 and len(floor) >= max_injected:
+            best = (
+                sim_weight * sim_score + decay_weight
+                if decay_enabled else sim_score
+            )
+            if (utility_rank, best + boost_headroom) < floor[0]:
                 continue
-            if not mem_domain:
-                created_by = lin.get("created_by_role")
-                if created_by and not _role_domain_overlaps(
-                    created_by, role_domains
-                ):
-                    continue
 
-        # Temporal decay
+        # Temporal decay (exempt memories keep full recency)
         if decay_enabled:
-            recency = _calc_recency_score(doc.metadata, decay_config)
-            blended = (
-                (1 - decay_weight) * sim_score + decay_weight * recency
-            )
+            if (
+                decay_rate <= 0
+                or cls.get("utility") in exempt_utils
+                or cls.get("source") in exempt_sources
+                or cls.get("validity") in exempt_validities
+            ):
+                recency = 1.0
+            else:
+                recency = _calc_recency_score(
+                    metadata, metadata.get(LIN_KEY, _EMPTY),
+                    now_ts, decay_rate, min_score,
+                )
+            blended = sim_weight * sim_score + decay_weight * recency
         else:
             blended = sim_score
 
-        utility_rank = _UTILITY_ORDER.get(utility, 0)
-        scored.append((doc, blended, utility_rank))
+        scored.append((doc, blended, utility_rank, metadata.get("id", "")))
+        if max_injected > 0:
+            if len(floor) < max_injected:
+                heapq.heappush(floor, (utility_rank, blended))
+            elif (utility_rank, blended) > floor[0]:
+                heapq.heapreplace(floor, (utility_rank, blended))
 
-    scored.sort(key=lambda x: (x[2], x[1]), reverse=True)
+    scored.sort(key=_RANK_KEY, reverse=True)
     return scored
 
 
-def _calc_recency_score(doc_metadata: dict, decay_config: dict) -> float:
-    """Exponential recency score. Returns 1.0 for exempt memories."""
-    cls = doc_metadata.get(CLS_KEY, {})
-    lin = doc_metadata.get(LIN_KEY, {})
-
-    # Exemption checks
-    if cls.get("utility") in decay_config.get("exempt_utilities", []):
-        return 1.0
-    if cls.get("source") in decay_config.get("exempt_sources", []):
-        return 1.0
-    if cls.get("validity") in decay_config.get("exempt_validities", []):
-        return 1.0
+def _calc_recency_score(
+    doc_metadata: dict, lin: dict, now_ts: float,
+    decay_rate: float, min_score: float,
+) -> float:
+    """Exponential recency score for a non-exempt memory.
 
+    Stage 2 handles exemptions and passes the extracted lineage dict plus
+    decay_rate = ln(2) / half_life, computed once per pass.
+    """
     # Age calculation: prefer last_accessed, fallback created_at, timestamp
     time_ref = (
         lin.get("last_accessed")
@@ -449,36 +672,36 @@ def _calc_recency_score(doc_metadata: dict, decay_config: dict) -> float:
         return 1.0
 
     try:
-        ref_dt = datetime.fromisoformat(time_ref)
-        if ref_dt.tzinfo is None:
-            ref_dt = ref_dt.replace(tzinfo=timezone.utc)
-        now = datetime.now(timezone.utc)
-        age_hours = max(0, (now - ref_dt).total_seconds() / 3600)
+        key = (doc_metadata.get("id", ""), time_ref)
+        ref_ts = _parsed_ts_cache.get(key)
+        if ref_ts is None:
+            ref_dt = datetime.fromisoformat(time_ref)
+            if ref_dt.tzinfo is None:
+                ref_dt = ref_dt.replace(tzinfo=timezone.utc)
+            ref_ts = ref_dt.timestamp()
+            if len(_parsed_ts_cache) >= MAX_PARSED_TS_CACHE:
+                _parsed_ts_cache.clear()
+            _parsed_ts_cache[key] = ref_ts
+        age_hours = max(0, (now_ts - ref_ts) / 3600)
     except Exception:
         return 1.0
 
-    half_life = decay_config.get("half_life_hours", 168)
-    if half_life <= 0:
-        return 1.0
-
-    decay_rate = math.log(2) / half_life
-    recency = math.exp(-decay_rate * age_hours)
-
-    min_score = decay_config.get("min_recency_score", 0.1)
-    return max(min_score, recency)
+    return max(min_score, math.exp(-decay_rate * age_hours))
 
 
 # ── Stage 3: Related Memory Boost ────────────────────────────────────────────
 
 def _apply_related_boost(
     scored: list[tuple],
-    all_docs: dict,
+    all_doc_ids,
     max_injected: int,
     related_config: dict,
 ) -> list[tuple]:
     """Boost near-cutoff memories that are linked to top-k selections.
 
-    Returns re-sorted scored list.
+    all_doc_ids is the docstore key view; related IDs that no longer exist
+    are dropped before the boost pass. Returns the scored list ranked
+    descending; after a boost only the top max_injected rows are kept.
     """
     if not related_config.get("enabled", True):
         return scored
@@ -490,32 +713,29 @@ def _apply_related_boost(
 
     # Collect related IDs from preliminary top-k
     related_ids = set()
-    for doc, _, _ in scored[:max_injected]:
-        if not hasattr(doc, "metadata"):
-            continue
+    for doc, _, _, _ in scored[:max_injected]:
         lin = doc.metadata.get(LIN_KEY, {})
         rids = lin.get("related_memory_ids", [])
         if isinstance(rids, list):
             related_ids.update(rids)
 
+    related_ids.intersection_update(all_doc_ids)
     if not related_ids:
         return scored
 
-    # Boost related memories that are below the cutoff
-    boosted = False
-    for i in range(max_injected, len(scored)):
-        doc, score, util_rank = scored[i]
-        if not hasattr(doc, "metadata"):
-            continue
-        doc_id = doc.metadata.get("id", "")
-        if doc_id in related_ids:
-            scored[i] = (doc, score + boost, util_rank)
-            boosted = True
+    # Boost related memories that are below the cutoff; the C-level
+    # intersection settles the common no-match case without a row loop
+    tail_ids = [row[3] for row in scored[max_injected:]]
+    boost_ids = related_ids.intersection(tail_ids)
+    if not boost_ids:
+        return scored
 
-    if boosted:
-        scored.sort(key=lambda x: (x[2], x[1]), reverse=True)
+    for i, doc_id in enumerate(tail_ids, max_injected):
+        if doc_id in boost_ids:
+            doc, score, util_rank, _ = scored[i]
+            scored[i] = (doc, score + boost, util_rank, doc_id)
 
-    return scored
+    return heapq.nlargest(max_injected, scored, key=_RANK_KEY)
 
 
 # ── BST Domain Access ────────────────────────────────────────────────────────
@@ -530,6 +750,25 @@ def _get_bst_domain(agent) -> str:
         return ""
 
 
+# ── Role Domains ─────────────────────────────────────────────────────────────
+
+def _get_role_domains(agent) -> frozenset:
+    """Active role's bst_domains as a frozenset, rebuilt only on role change.
+
+    The dispatcher swaps the whole role dict, so identity is a sufficient
+    change check; the frozenset makes Stage 2 membership tests O(1).
+    """
+    role = getattr(agent, "_org_active_role", None)
+    cached = getattr(agent, "_mem_role_domains", None)
+    if cached is not None and cached[0] is role:
+        return cached[1]
+    domains = frozenset(
+        role.get("capabilities", {}).get("bst_domains", [])
+    ) if role else frozenset()
+    agent._mem_role_domains = (role, domains)
+    return domains
+
+
 # ── Query Extraction ─────────────────────────────────────────────────────────
 
 def _get_query(loop_data) -> str:
@@ -551,15 +790,16 @@ def _role_domain_overlaps(
 ) -> bool:
     """Check if the creating role's domains overlap with current role."""
     try:
-        path = os.path.join(ROLES_DIR, f"{created_by_role}.json")
-        if not os.path.isfile(path):
-            return True
-        with open(path, "r", encoding="utf-8") as f:
-            profile = json.load(f)
-        creator_domains = profile.get(
-            "capabilities", {}
-        ).get("bst_domains", [])
-        return bool(set(creator_domains) & set(current_domains))
+        profile = _cached_json(
+            os.path.join(ROLES_DIR, f"{created_by_role}.json")
+        )
+        hit = _ROLE_DOMAINS.get(created_by_role)
+        if hit is None or hit[0] is not profile:
+            hit = (profile, frozenset(
+                profile.get("capabilities", {}).get("bst_domains", [])
+            ))
+            _ROLE_DOMAINS[created_by_role] = hit
+        return not hit[1].isdisjoint(current_domains)
     except Exception:
         return True
 
@@ -567,10 +807,12 @@ def _role_domain_overlaps(
 # ── Access Tracking ──────────────────────────────────────────────────────────
 
 def _update_access(
-    filtered_results: list[tuple], all_docs: dict,
+    filtered_results: list[tuple], all_docs: dict, now: str, now_ts: float,
 ) -> list[str]:
-    """Increment access_count on injected memories. Returns list of IDs."""
-    now = datetime.now(timezone.utc).isoformat()
+    """Increment access_count on injected memories. Returns list of IDs.
+
+    now / now_ts are the turn's ISO and POSIX clock readings.
+    """
     injected_ids = []
 
     for doc, _ in filtered_results:
@@ -604,19 +846,112 @@ def _update_access(
 
         lin["access_count"] = lin.get("access_count", 0) + 1
         lin["last_accessed"] = now
+        original.metadata.pop(LEGACY_PARSED_TS_KEY, None)
+        if len(_parsed_ts_cache) >= MAX_PARSED_TS_CACHE:
+            _parsed_ts_cache.clear()
+        _parsed_ts_cache[(doc_id, now)] = now_ts
 
     return injected_ids
 
 
+# ── Access Persistence ───────────────────────────────────────────────────────
+
+def _persist_access(agent, db, bst_domain: str):
+    """Save the docstore once per batch of access updates.
+
+    Updates are already live on the in-memory documents, so recall is
+    unaffected between saves. A save is due after SAVE_INTERVAL dirty
+    turns, SAVE_MAX_AGE_S seconds, or a BST domain change.
+    """
+    now = time.monotonic()
+    last_save = getattr(agent, "_mem_last_save", None)
+    if last_save is None:
+        last_save = agent._mem_last_save = now
+        agent._mem_save_domain = bst_domain
+
+    dirty = getattr(agent, "_mem_dirty_turns", 0) + 1
+    if (
+        dirty < SAVE_INTERVAL
+        and now - last_save < SAVE_MAX_AGE_S
+        and bst_domain == agent._mem_save_domain
+    ):
+        agent._mem_dirty_turns = dirty
+        _DIRTY_DBS[id(db)] = db
+        return
+
+    try:
+        db._save_db()
+    except Exception:
+        pass
+    _DIRTY_DBS.pop(id(db), None)
+    agent._mem_dirty_turns = 0
+    agent._mem_last_save = now
+    agent._mem_save_domain = bst_domain
+
+
+def _flush_dirty_dbs():
+    """Save any docstore still holding unsaved access updates."""
+    for db in list(_DIRTY_DBS.values()):
+        try:
+            db._save_db()
+        except Exception:
+            pass
+    _DIRTY_DBS.clear()
+
+
+atexit.register(_flush_dirty_dbs)
+
+
 # ── Co-Retrieval Logging ─────────────────────────────────────────────────────
 
 def _log_co_retrieval(
-    memory_ids: list[str], query_domain: str, cycle: int,
+    memory_ids: list[str], query_domain: str, cycle: int, now_iso: str,
 ):
-    """Append co-retrieval entry. FIFO eviction at max_entries."""
+    """Append a co-retrieval entry to the pending JSONL log.
+
+    Every CO_RETRIEVAL_COMPACT_EVERY appends (and on the first append in a
+    process) the pending lines are folded into the JSON log read by
+    _57_memory_maintenance and _59_ontology_maintenance.
+    """
+    global _co_pending
     if len(memory_ids) < 2:
         return
 
+    entry = {
+        "timestamp": now_iso,
+        "query_domain": query_domain,
+        "memory_ids": memory_ids,
+        "cycle": cycle,
+    }
+    try:
+        os.makedirs(os.path.dirname(CO_RETRIEVAL_PENDING), exist_ok=True)
+        with open(CO_RETRIEVAL_PENDING, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    except Exception:
+        return
+
+    if _co_pending is None or _co_pending + 1 >= CO_RETRIEVAL_COMPACT_EVERY:
+        _compact_co_retrieval()
+        _co_pending = 0
+    else:
+        _co_pending += 1
+
+
+def _compact_co_retrieval():
+    """Fold pending JSONL entries into the JSON log (FIFO at max_entries)."""
+    try:
+        with open(CO_RETRIEVAL_PENDING, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except Exception:
+        return
+
+    pending = []
+    for line in lines:
+        try:
+            pending.append(json.loads(line))
+        except ValueError:
+            continue  # torn line from an interrupted append
+
     log_data = {"max_entries": MAX_CO_RETRIEVAL_ENTRIES, "entries": []}
     try:
         if os.path.isfile(CO_RETRIEVAL_LOG):
@@ -626,15 +961,8 @@ def _log_co_retrieval(
         pass
 
     entries = log_data.get("entries", [])
+    entries.extend(pending)
     max_entries = log_data.get("max_entries", MAX_CO_RETRIEVAL_ENTRIES)
-
-    entries.append({
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "query_domain": query_domain,
-        "memory_ids": memory_ids,
-        "cycle": cycle,
-    })
-
     if len(entries) > max_entries:
         entries = entries[-max_entries:]
 
@@ -643,9 +971,11 @@ def _log_co_retrieval(
         log_data["cluster_candidates"] = []
 
     try:
-        os.makedirs(os.path.dirname(CO_RETRIEVAL_LOG), exist_ok=True)
-        with open(CO_RETRIEVAL_LOG, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2)
+        tmp_path = CO_RETRIEVAL_LOG + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(log_data, f, separators=(",", ":"))
+        os.replace(tmp_path, CO_RETRIEVAL_LOG)
+        os.remove(CO_RETRIEVAL_PENDING)
     except Exception:
         pass
 
@@ -654,20 +984,27 @@ def _log_co_retrieval(
 
 def _load_profile_memory_section() -> dict:
     """Load memory section from active model profile."""
+    global _profile_path_cache
     try:
-        if not os.path.isdir(PROFILE_DIR):
-            return {}
-        default = os.path.join(PROFILE_DIR, "default.json")
-        profile_path = default
-        for name in os.listdir(PROFILE_DIR):
-            if name != "default.json" and name.endswith(".json"):
-                profile_path = os.path.join(PROFILE_DIR, name)
-                break
-        if not os.path.isfile(profile_path):
-            return {}
-        with open(profile_path, "r", encoding="utf-8") as f:
-            profile = json.load(f)
-        return profile.get("memory", {})
+        # The directory mtime only moves when profiles are added/removed,
+        # so the scan result is reused until then
+        dir_mtime = os.stat(PROFILE_DIR).st_mtime_ns
+        cached = _profile_path_cache
+        if cached is not None and cached[0] == dir_mtime:
+            profile_path = cached[1]
+        else:
+            profile_path = os.path.join(PROFILE_DIR, "default.json")
+            with os.scandir(PROFILE_DIR) as it:
+                for entry in it:
+                    if (
+                        entry.name != "default.json"
+                        and entry.name.endswith(".json")
+                        and entry.is_file()
+                    ):
+                        profile_path = entry.path
+                        break
+            _profile_path_cache = (dir_mtime, profile_path)
+        return _cached_json(profile_path).get("memory", {})
     except Exception:
         return {}
 
@@ -677,12 +1014,26 @@ def _load_profile_memory_section() -> dict:
 def _load_config() -> dict:
     """Load classification config with defaults."""
     try:
-        if os.path.isfile(CONFIG_PATH):
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                user_config = json.load(f)
-            merged = dict(DEFAULT_CONFIG)
-            merged.update(user_config)
-            return merged
+        user_config = _cached_json(CONFIG_PATH)
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(user_config)
+        return merged
     except Exception:
         pass
     return dict(DEFAULT_CONFIG)
+
+
+def _cached_json(path: str) -> dict:
+    """Load a JSON file, reusing the parsed copy while its mtime is unchanged.
+
+    Raises OSError if the file is missing; callers keep their own fallbacks.
+    The returned dict is shared across calls and must not be mutated.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    _JSON_CACHE[path] = (mtime, data)
+    return data
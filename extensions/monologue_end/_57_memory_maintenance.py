@@ -532,7 +532,7 @@ def _detect_cluster_candidates() -> int:
     # Write back (even if only updating counts)
     try:
         with open(CO_RETRIEVAL_LOG, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2)
+            json.dump(log_data, f, separators=(",", ":"))
     except Exception:
         pass
 
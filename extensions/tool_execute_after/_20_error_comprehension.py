@@ -18,23 +18,32 @@ Reads:
   - response.message (from hook kwargs)
   - /a0/usr/memory/classification_config.json (error_comprehension section, optional)
 Writes:
-  - agent._error_diagnosis (via set_data) — cleared at start of each call
+  - agent._error_diagnosis (via set_data) — replaced on each call; written
+    only when it changes
   - agent context (via hist_add_warning, if inject_into_context enabled)
 """
 
 import json
 import os
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from python.helpers.extension import Extension
-from python.helpers.tool import Response
+
+if TYPE_CHECKING:
+    from python.helpers.tool import Response
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
 CONFIG_PATH = "/a0/usr/memory/classification_config.json"
 DIAGNOSIS_KEY = "_error_diagnosis"
 
+# Long outputs are scanned as head + tail only: prompts, hung-session notices
+# and final status lines sit at the end; ^-anchored patterns need the start.
+# The tail window is SCAN_TAIL_FACTOR * max_output_tail_chars.
+SCAN_HEAD_CHARS = 1024
+SCAN_TAIL_FACTOR = 4
+
 DEFAULT_CONFIG = {
     "enabled": True,
     "inject_into_context": True,
@@ -45,19 +54,19 @@ DEFAULT_CONFIG = {
 # ── Signal / Indicator Lists ──────────────────────────────────────────────────
 
 SUCCESS_INDICATORS = [
-    r"(?i)successfully installed",
-    r"(?i)successfully built",
-    r"(?i)requirement already satisfied",
-    r"(?i)already installed",
-    r"(?i)is up to date",
-    r"(?i)install complete",
-    r"(?i)done\.\s*$",
-    r"(?i)^ok\b",
-    r"(?i)setting up \S+",
-    r"(?i)unpacking \S+",
-    r"(?i)processing triggers",
-    r"(?i)created wheel for",
-    r"(?i)stored in directory:",
+    r"successfully installed",
+    r"successfully built",
+    r"requirement already satisfied",
+    r"already installed",
+    r"is up to date",
+    r"install complete",
+    r"done\.\s*$",
+    r"^ok\b",
+    r"setting up \S+",
+    r"unpacking \S+",
+    r"processing triggers",
+    r"created wheel for",
+    r"stored in directory:",
 ]
 
 ERROR_CLASSES = [
@@ -65,14 +74,20 @@ ERROR_CLASSES = [
         "class": "interactive_prompt",
         "description": "Command waiting for stdin input that cannot be provided",
         "signals": [
-            r"(?i)(enter|input|password|key|token|confirm|y/n|press)\s*[:>]\s*$",
-            r"(?i)\?\s*$",
+            r"(enter|input|password|key|token|confirm|y/n|press)\s*[:>]\s*$",
+            r"\?\s*$",
+        ],
+        # Framework-emitted notices: matched case-sensitively, after "signals"
+        "exact_signals": [
             "Potential dialog detected",
         ],
+        # Substrings (lowercase) at least one of which every signal needs
+        "signal_literals": [":", ">", "?", "potential dialog detected"],
         "anti_signals": [
-            r"(?i)successfully",
-            r"(?i)complete",
+            r"successfully",
+            r"complete",
         ],
+        "anti_literals": ["successfully", "complete"],
         "causal_chain": (
             "Command entered interactive mode requiring keyboard input. "
             "This execution environment cannot provide stdin input to running commands."
@@ -93,10 +108,13 @@ ERROR_CLASSES = [
     {
         "class": "terminal_session_hung",
         "description": "Previous command still occupying the terminal session",
-        "signals": [
+        "signals": [],
+        "exact_signals": [
             r"Terminal session \d+ might be still running",
         ],
+        "signal_literals": ["might be still running"],
         "anti_signals": [],
+        "anti_literals": [],
         "causal_chain": (
             "A previous command is still running or hung in this terminal session. "
             "New commands cannot execute until the session is reset."
@@ -115,14 +133,30 @@ ERROR_CLASSES = [
 
 # ── Pre-compile all regexes at module level ───────────────────────────────────
 
-_SUCCESS_RX = [re.compile(p) for p in SUCCESS_INDICATORS]
+# Plain-phrase success indicators are matched as lowercase substrings (one
+# lower() plus C-level `in` scans); only real patterns go through regex
+# Indicators, signals and anti-signals are case-insensitive (re.IGNORECASE
+# at compile time); only "exact_signals" keep their case.
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+_SUCCESS_LITERALS = tuple(
+    p.lower() for p in SUCCESS_INDICATORS if not _REGEX_META.intersection(p)
+)
+_SUCCESS_RX = [
+    re.compile(p, re.IGNORECASE) for p in SUCCESS_INDICATORS
+    if _REGEX_META.intersection(p)
+]
 
 _COMPILED_CLASSES = []
 for _cls in ERROR_CLASSES:
     _COMPILED_CLASSES.append({
         **_cls,
-        "_sig_rx": [re.compile(s) for s in _cls["signals"]],
-        "_anti_rx": [re.compile(a) for a in _cls["anti_signals"]],
+        "_sig_rx": (
+            [re.compile(s, re.IGNORECASE) for s in _cls["signals"]]
+            + [re.compile(s) for s in _cls.get("exact_signals", ())]
+        ),
+        "_anti_rx": [re.compile(a, re.IGNORECASE) for a in _cls["anti_signals"]],
+        "_sig_lits": tuple(_cls.get("signal_literals", ())),
+        "_anti_lits": tuple(_cls.get("anti_literals", ())),
     })
 
 
@@ -136,66 +170,31 @@ class ErrorComprehension(Extension):
     regex classification.
     """
 
-    async def execute(self, response: Response | None = None, **kwargs) -> Any:
+    async def execute(self, response: "Response | None" = None, **kwargs) -> Any:
         try:
-            # Step 1: Always clear previous diagnosis — prevent stale state leaking
-            self.agent.set_data(DIAGNOSIS_KEY, None)
+            # Step 1: Read the previous diagnosis — it is replaced below, never
+            # left stale, but only written when the value actually changes
+            prev = self.agent.get_data(DIAGNOSIS_KEY)
 
-            # Step 2: Early exit on no response or empty message
-            if not response or not response.message:
-                return
-
-            config = _load_config()
-            if not config.get("enabled", True):
-                return
-
-            msg = response.message
-            max_tail = config.get("max_output_tail_chars", 500)
-
-            # Step 3: Success fast path — any SUCCESS_INDICATOR match → no diagnosis
-            for rx in _SUCCESS_RX:
-                if rx.search(msg):
-                    return
-
-            # Step 4: Run classifiers in order, first match wins
+            # Step 2: Classify (no response, empty message or disabled → None)
             diagnosis = None
-            for cls in _COMPILED_CLASSES:
-                # Anti-signals first — if any match, skip this class
-                skip = False
-                for anti_rx in cls["_anti_rx"]:
-                    if anti_rx.search(msg):
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                # Signal patterns — any single match is sufficient
-                matched_pattern = None
-                for sig_rx in cls["_sig_rx"]:
-                    if sig_rx.search(msg):
-                        matched_pattern = sig_rx.pattern
-                        break
-
-                if matched_pattern is not None:
-                    tail = msg[-max_tail:] if len(msg) > max_tail else msg
-                    diagnosis = {
-                        "error_class": cls["class"],
-                        "confidence": cls["confidence"],
-                        "evidence": [matched_pattern],
-                        "causal_chain": cls["causal_chain"],
-                        "suggested_actions": cls["suggested_actions"],
-                        "anti_actions": cls["anti_actions"],
-                        "raw_output_tail": tail,
-                    }
-                    break
+            config = None
+            try:
+                if response and response.message:
+                    config = _load_config()
+                    if config.get("enabled", True):
+                        diagnosis = _diagnose(response.message, config)
+            except Exception:
+                diagnosis = None
+
+            # Step 3: Single write to shared state
+            if diagnosis is not prev and diagnosis != prev:
+                self.agent.set_data(DIAGNOSIS_KEY, diagnosis)
 
             if diagnosis is None:
                 return
 
-            # Step 5: Write diagnosis to shared state
-            self.agent.set_data(DIAGNOSIS_KEY, diagnosis)
-
-            # Step 6: Log the classification
+            # Step 4: Log the classification
             try:
                 self.agent.context.log.log(
                     type="warning",
@@ -204,9 +203,12 @@ class ErrorComprehension(Extension):
             except Exception:
                 pass
 
-            # Step 7: Inject compact structured summary into context
+            # Step 5: Inject compact structured summary into context
             if config.get("inject_into_context", True):
-                summary = _format_summary(diagnosis)
+                summary = _SUMMARY_CACHE.get(diagnosis["error_class"])
+                if summary is None:
+                    summary = _format_summary(diagnosis)
+                    _SUMMARY_CACHE[diagnosis["error_class"]] = summary
                 try:
                     self.agent.hist_add_warning(summary)
                 except Exception:
@@ -216,8 +218,67 @@ class ErrorComprehension(Extension):
             pass
 
 
+# ── Classification ────────────────────────────────────────────────────────────
+
+def _diagnose(msg: str, config: dict) -> dict | None:
+    """Classify one tool output; None on success output or no class match."""
+    max_tail = config.get("max_output_tail_chars", 500)
+    scan_tail = SCAN_TAIL_FACTOR * max_tail
+    if len(msg) > SCAN_HEAD_CHARS + scan_tail:
+        scan = msg[:SCAN_HEAD_CHARS] + "\n" + msg[-scan_tail:]
+    else:
+        scan = msg
+
+    # Success fast path — any SUCCESS_INDICATOR match → no diagnosis
+    msg_lower = scan.lower()
+    if any(lit in msg_lower for lit in _SUCCESS_LITERALS):
+        return None
+    for rx in _SUCCESS_RX:
+        if rx.search(scan):
+            return None
+
+    # Run classifiers in order, first match wins
+    for cls in _COMPILED_CLASSES:
+        # Literal prefilter — no required substring, no signal can match
+        sig_lits = cls["_sig_lits"]
+        if sig_lits and not any(lit in msg_lower for lit in sig_lits):
+            continue
+
+        # Anti-signals first — if any match, skip this class
+        skip = False
+        anti_lits = cls["_anti_lits"]
+        if not anti_lits or any(lit in msg_lower for lit in anti_lits):
+            for anti_rx in cls["_anti_rx"]:
+                if anti_rx.search(scan):
+                    skip = True
+                    break
+        if skip:
+            continue
+
+        # Signal patterns — any single match is sufficient
+        for sig_rx in cls["_sig_rx"]:
+            if sig_rx.search(scan):
+                tail = msg[-max_tail:] if len(msg) > max_tail else msg
+                return {
+                    "error_class": cls["class"],
+                    "confidence": cls["confidence"],
+                    "evidence": [sig_rx.pattern],
+                    "causal_chain": cls["causal_chain"],
+                    "suggested_actions": cls["suggested_actions"],
+                    "anti_actions": cls["anti_actions"],
+                    "raw_output_tail": tail,
+                }
+
+    return None
+
+
 # ── Context Formatting ────────────────────────────────────────────────────────
 
+# error_class -> formatted summary. Every field the summary shows comes from
+# the static ERROR_CLASSES entry, so each class is formatted at most once.
+_SUMMARY_CACHE: dict[str, str] = {}
+
+
 def _format_summary(diagnosis: dict) -> str:
     """Format diagnosis as compact structured summary for context injection."""
     lines = [
@@ -227,33 +288,41 @@ def _format_summary(diagnosis: dict) -> str:
 
     suggested = diagnosis.get("suggested_actions", [])
     if suggested:
-        lines.append("")
-        lines.append("  Do this:")
-        for i, action in enumerate(suggested, 1):
-            lines.append(f"  {i}. {action}")
+        lines += ("", "  Do this:")
+        lines.extend(f"  {i}. {action}" for i, action in enumerate(suggested, 1))
 
     anti = diagnosis.get("anti_actions", [])
     if anti:
-        lines.append("")
-        lines.append("  Do NOT:")
-        for action in anti:
-            lines.append(f"  - {action}")
+        lines += ("", "  Do NOT:")
+        lines.extend(f"  - {action}" for action in anti)
 
     return "\n".join(lines)
 
 
 # ── Config Loading ────────────────────────────────────────────────────────────
 
+# (st_mtime_ns, merged config) from the last successful load
+_config_cache: tuple[int, dict] | None = None
+
+
 def _load_config() -> dict:
-    """Load error_comprehension config section with defaults."""
+    """Load error_comprehension config section with defaults.
+
+    Re-reads the file only when its mtime changes; the returned dict is
+    shared between calls and must not be mutated.
+    """
+    global _config_cache
     try:
-        if os.path.isfile(CONFIG_PATH):
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                full = json.load(f)
-            section = full.get("error_comprehension", {})
-            merged = dict(DEFAULT_CONFIG)
-            merged.update(section)
-            return merged
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        if _config_cache is not None and _config_cache[0] == mtime:
+            return _config_cache[1]
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            full = json.load(f)
+        section = full.get("error_comprehension", {})
+        merged = dict(DEFAULT_CONFIG)
+        merged.update(section)
+        _config_cache = (mtime, merged)
+        return merged
     except Exception:
         pass
     return dict(DEFAULT_CONFIG)
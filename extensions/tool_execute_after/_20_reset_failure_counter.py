@@ -1,12 +1,16 @@
+from typing import TYPE_CHECKING
+
 from python.helpers.extension import Extension
-from python.helpers.tool import Response
+
+if TYPE_CHECKING:
+    from python.helpers.tool import Response
 
 # Must match the key used in error_format/_30_failure_tracker.py
 TRACKER_KEY = "_failure_tracker"
 
 
 class ResetFailureCounter(Extension):
-    async def execute(self, response: Response | None = None, **kwargs):
+    async def execute(self, response: "Response | None" = None, **kwargs):
         """Reset the consecutive failure counter for a tool on successful execution."""
         if not response:
             return
@@ -1,37 +1,71 @@
 import re
+from collections import deque
+from typing import TYPE_CHECKING
+
 from python.helpers.extension import Extension
-from python.helpers.tool import Response
+
+if TYPE_CHECKING:
+    from python.helpers.tool import Response
 
 FAILURES_KEY = "_tool_failures"
 MAX_HISTORY = 20
+PREVIEW_CHARS = 150  # message_preview length per history entry
+
+# Long outputs are classified on head + tail only (same window as
+# _20_error_comprehension.py at its default max_output_tail_chars)
+SCAN_HEAD_CHARS = 1024
+SCAN_TAIL_CHARS = 2000
 
 SUCCESS_INDICATORS = [
-    r"(?i)successfully installed",
-    r"(?i)successfully built",
-    r"(?i)requirement already satisfied",
-    r"(?i)already installed",
-    r"(?i)is up to date",
-    r"(?i)install complete",
-    r"(?i)done\.\s*$",
-    r"(?i)^ok\b",
-    r"(?i)setting up \S+",
-    r"(?i)unpacking \S+",
-    r"(?i)processing triggers",
-    r"(?i)created wheel for",
-    r"(?i)stored in directory:",
+    r"successfully installed",
+    r"successfully built",
+    r"requirement already satisfied",
+    r"already installed",
+    r"is up to date",
+    r"install complete",
+    r"done\.\s*$",
+    r"^ok\b",
+    r"setting up \S+",
+    r"unpacking \S+",
+    r"processing triggers",
+    r"created wheel for",
+    r"stored in directory:",
 ]
 
 ERROR_PATTERNS = [
-    (r"(?i)timeout|timed?\s*out|deadline exceeded|connection.*reset", "timeout"),
-    (r"(?i)not found|no such file|does not exist|404|command not found|unknown tool", "not_found"),
-    (r"(?i)permission denied|access denied|forbidden|403|unauthorized|401", "permission"),
-    (r"(?i)syntax error|invalid argument|unexpected token|parse error|malformed|missing required", "syntax"),
-    (r"(?i)connection refused|network unreachable|DNS|ECONNREFUSED|could not resolve", "network"),
-    (r"(?i)out of memory|disk full|no space left|quota exceeded|resource exhausted", "resource"),
-    (r"(?i)no module named|import error|ModuleNotFoundError|package.*not installed", "dependency"),
-    (r"(?i)^ERROR:|^error:|Traceback \(most recent|raise \w+Error|FATAL|CRITICAL", "execution"),
+    (r"timeout|timed?\s*out|deadline exceeded|connection.*reset", "timeout"),
+    (r"not found|no such file|does not exist|404|command not found|unknown tool", "not_found"),
+    (r"permission denied|access denied|forbidden|403|unauthorized|401", "permission"),
+    (r"syntax error|invalid argument|unexpected token|parse error|malformed|missing required", "syntax"),
+    (r"connection refused|network unreachable|DNS|ECONNREFUSED|could not resolve", "network"),
+    (r"out of memory|disk full|no space left|quota exceeded|resource exhausted", "resource"),
+    (r"no module named|import error|ModuleNotFoundError|package.*not installed", "dependency"),
+    (r"^ERROR:|^error:|Traceback \(most recent|raise \w+Error|FATAL|CRITICAL", "execution"),
 ]
 
+# Pre-compiled at import; every pattern is case-insensitive (re.IGNORECASE).
+# Success indicators that are plain phrases are matched as lowercase
+# substrings; the rest are fused into one alternation (any hit means
+# success). Error patterns are fused into one named-group alternation that
+# finds a match in a single pass; list order still decides priority, so
+# only the patterns ranked above the hit are re-checked individually.
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+_SUCCESS_LITERALS = tuple(
+    p.lower() for p in SUCCESS_INDICATORS if not _REGEX_META.intersection(p)
+)
+_SUCCESS_ANY = re.compile(
+    "|".join(
+        f"(?:{p})" for p in SUCCESS_INDICATORS if _REGEX_META.intersection(p)
+    ),
+    re.IGNORECASE,
+)
+_ERROR_ANY = re.compile(
+    "|".join(f"(?P<{t}>{p})" for p, t in ERROR_PATTERNS),
+    re.IGNORECASE,
+)
+_ERROR_RX = [(re.compile(p, re.IGNORECASE), t) for p, t in ERROR_PATTERNS]
+_ERROR_RANK = {t: i for i, (_, t) in enumerate(ERROR_PATTERNS)}
+
 
 class ToolFallbackLogger(Extension):
     """Classifies tool execution results and logs failures for the fallback advisor.
@@ -41,7 +75,7 @@ class ToolFallbackLogger(Extension):
     after a sequence of resolved errors.
     """
 
-    async def execute(self, response: Response | None = None, **kwargs):
+    async def execute(self, response: "Response | None" = None, **kwargs):
         try:
             if not response:
                 return
@@ -58,25 +92,44 @@ class ToolFallbackLogger(Extension):
                 error_type = self._classify_response(response.message)
 
             failures = self.agent.get_data(FAILURES_KEY) or {}
-            if "history" not in failures:
-                failures["history"] = []
+
+            # Success on clean state (the common case): nothing to reset
+            if not error_type and not failures.get("history") and not (
+                failures.get("consecutive", {}).get(tool_name)
+            ):
+                return
+
+            # Bounded history: the deque drops the oldest entry on append.
+            # (Underscore keys are not persisted, so the deque stays in memory.)
+            history = failures.get("history")
+            if not isinstance(history, deque):
+                history = failures["history"] = deque(history or (), maxlen=MAX_HISTORY)
             if "consecutive" not in failures:
                 failures["consecutive"] = {}
 
+            if "last_error_by_tool" not in failures:
+                failures["last_error_by_tool"] = {}
+
             if not error_type:
                 failures["consecutive"][tool_name] = 0
-                failures["history"] = []
+                history.clear()
+                failures["last_error_by_tool"] = {}
                 self.agent.set_data(FAILURES_KEY, failures)
                 return
 
-            failures["history"].append({
+            full = len(history) == MAX_HISTORY
+            history.append({
                 "tool": tool_name,
                 "error_type": error_type,
-                "message_preview": response.message[:150],
+                "message_preview": response.message[:PREVIEW_CHARS],
             })
+            failures["last_error_by_tool"][tool_name] = error_type
 
-            if len(failures["history"]) > MAX_HISTORY:
-                failures["history"] = failures["history"][-MAX_HISTORY:]
+            if full:
+                # Mirror the dropped entry: tools whose entries fell out go too
+                failures["last_error_by_tool"] = {
+                    e["tool"]: e["error_type"] for e in history
+                }
 
             prev = failures["consecutive"].get(tool_name, 0)
             failures["consecutive"][tool_name] = prev + 1
@@ -90,12 +143,24 @@ class ToolFallbackLogger(Extension):
         if not message:
             return None
 
-        for pattern in SUCCESS_INDICATORS:
-            if re.search(pattern, message):
-                return None
+        if len(message) > SCAN_HEAD_CHARS + SCAN_TAIL_CHARS:
+            message = (
+                message[:SCAN_HEAD_CHARS] + "\n" + message[-SCAN_TAIL_CHARS:]
+            )
 
-        for pattern, error_type in ERROR_PATTERNS:
-            if re.search(pattern, message):
-                return error_type
+        message_lower = message.lower()
+        if any(lit in message_lower for lit in _SUCCESS_LITERALS):
+            return None
+        if _SUCCESS_ANY.search(message):
+            return None
 
-        return None
+        m = _ERROR_ANY.search(message)
+        if m is None:
+            return None
+
+        # The fused match is the leftmost hit; a higher-priority pattern
+        # may still match further along
+        for rx, error_type in _ERROR_RX[:_ERROR_RANK[m.lastgroup]]:
+            if rx.search(message):
+                return error_type
+        return m.lastgroup
@@ -1,5 +1,12 @@
+import os
+
 from python.helpers.extension import Extension
-from typing import Any
+from typing import Any, NamedTuple
+
+# Environment switch — "off" drops the info-level auto-correction log lines
+# (their f-strings are then never built); warnings are always logged
+METAGATE_LOG_ENV = "EXO_METAGATE_LOG"
+_LOG_INFO = os.environ.get(METAGATE_LOG_ENV, "").strip().lower() != "off"
 
 # Static schema: tool_name -> {required_args, arg_aliases, runtime_aliases}
 TOOL_SCHEMAS = {
@@ -107,6 +114,53 @@ TOOL_SCHEMAS = {
 }
 
 
+class _CompiledSchema(NamedTuple):
+    """TOOL_SCHEMAS entry flattened once at import; read-only."""
+    required: tuple
+    cond_req: dict              # arg -> ((condition arg, frozenset of skip values), ...)
+    arg_aliases: dict           # wrong name -> correct name, schema order
+    value_aliases: dict
+    defaults: dict
+    required_set: frozenset
+    is_trivial: bool            # only arg renames + the required check apply
+
+
+def _norm(val: Any) -> str:
+    """Case/whitespace-normalized form of an arg value for alias matching."""
+    return (val if isinstance(val, str) else str(val)).lower().strip()
+
+
+def _is_blank(val: Any) -> bool:
+    return val is None or (isinstance(val, str) and not val.strip())
+
+
+def _compile_schema(schema: dict) -> _CompiledSchema:
+    required = tuple(schema.get("required", ()))
+    # skip_when lists become frozensets of normalized values, matched
+    # against _norm() of the condition arg
+    cond_req = {
+        arg: tuple(
+            (cond_arg, frozenset(_norm(v) for v in skip_values))
+            for cond_arg, skip_values in rule.get("skip_when", {}).items()
+        )
+        for arg, rule in schema.get("conditionally_required", {}).items()
+    }
+    value_aliases = schema.get("value_aliases", {})
+    defaults = schema.get("defaults", {})
+    return _CompiledSchema(
+        required=required,
+        cond_req=cond_req,
+        arg_aliases=schema.get("arg_aliases", {}),
+        value_aliases=value_aliases,
+        defaults=defaults,
+        required_set=frozenset(required),
+        is_trivial=not (cond_req or value_aliases or defaults),
+    )
+
+
+_COMPILED_SCHEMAS = {name: _compile_schema(s) for name, s in TOOL_SCHEMAS.items()}
+
+
 class MetaReasoningGate(Extension):
     """Validates and auto-corrects tool arguments before execution.
 
@@ -123,15 +177,23 @@ class MetaReasoningGate(Extension):
             if not tool_args or not tool_name:
                 return
 
-            schema = TOOL_SCHEMAS.get(tool_name)
+            schema = _COMPILED_SCHEMAS.get(tool_name)
             if not schema:
                 return  # Unknown tool, let it pass through
 
+            # Fast path (the common case): nothing to rename, fix or default,
+            # and every required arg is present and non-empty
+            if (schema.is_trivial
+                    and schema.required_set.issubset(tool_args)
+                    and tool_args.keys().isdisjoint(schema.arg_aliases)
+                    and not any(_is_blank(tool_args[a]) for a in schema.required)):
+                return
+
             # Phase 1: Fix argument name aliases
-            self._fix_arg_aliases(tool_args, schema)
+            self._fix_arg_aliases(tool_args, schema, _LOG_INFO)
 
             # Phase 2: Fix value aliases (e.g. runtime: "bash" -> "terminal")
-            self._fix_value_aliases(tool_args, schema)
+            self._fix_value_aliases(tool_args, schema, _LOG_INFO)
 
             # Phase 3: Apply defaults for missing optional args
             self._apply_defaults(tool_args, schema)
@@ -161,12 +223,23 @@ class MetaReasoningGate(Extension):
             except Exception:
                 pass
 
-    def _fix_arg_aliases(self, tool_args: dict, schema: dict):
+    def _fix_arg_aliases(self, tool_args: dict, schema: _CompiledSchema,
+                         log_info: bool = True):
         """Rename wrong argument names to correct ones."""
-        aliases = schema.get("arg_aliases", {})
-        for wrong_name, correct_name in aliases.items():
-            if wrong_name in tool_args and correct_name not in tool_args:
+        aliases = schema.arg_aliases
+        # Walk the (few) args rather than every alias; several hits are
+        # applied in schema order so the first-listed alias still wins
+        hits = [k for k in tool_args if k in aliases]
+        if not hits:
+            return
+        if len(hits) > 1:
+            hits = [k for k in aliases if k in hits]
+        for wrong_name in hits:
+            correct_name = aliases[wrong_name]
+            if correct_name not in tool_args:
                 tool_args[correct_name] = tool_args.pop(wrong_name)
+                if not log_info:
+                    continue
                 try:
                     self.agent.context.log.log(
                         type="info",
@@ -175,15 +248,17 @@ class MetaReasoningGate(Extension):
                 except Exception:
                     pass
 
-    def _fix_value_aliases(self, tool_args: dict, schema: dict):
+    def _fix_value_aliases(self, tool_args: dict, schema: _CompiledSchema,
+                           log_info: bool = True):
         """Fix wrong argument values (e.g. runtime: bash -> terminal)."""
-        value_aliases = schema.get("value_aliases", {})
-        for arg_name, alias_map in value_aliases.items():
+        for arg_name, alias_map in schema.value_aliases.items():
             if arg_name in tool_args:
-                current_val = str(tool_args[arg_name]).lower().strip()
+                current_val = _norm(tool_args[arg_name])
                 if current_val in alias_map:
                     corrected = alias_map[current_val]
                     tool_args[arg_name] = corrected
+                    if not log_info:
+                        continue
                     try:
                         self.agent.context.log.log(
                             type="info",
@@ -193,26 +268,29 @@ class MetaReasoningGate(Extension):
                     except Exception:
                         pass
 
-    def _apply_defaults(self, tool_args: dict, schema: dict):
+    def _apply_defaults(self, tool_args: dict, schema: _CompiledSchema):
         """Fill in missing optional args with defaults."""
-        defaults = schema.get("defaults", {})
-        for arg_name, default_val in defaults.items():
+        for arg_name, default_val in schema.defaults.items():
             if arg_name not in tool_args:
                 tool_args[arg_name] = default_val
 
-    def _check_required(self, tool_args: dict, schema: dict) -> list[str]:
+    def _check_required(self, tool_args: dict, schema: _CompiledSchema) -> list[str]:
         """Return list of missing required argument names."""
-        required = schema.get("required", [])
-        conditionally_required = schema.get("conditionally_required", {})
+        conditionally_required = schema.cond_req
         missing = []
+        norm_cache = {}  # condition arg -> normalized value, shared across args
 
-        for arg in required:
+        for arg in schema.required:
             # Check if this arg has conditional skip rules
-            if arg in conditionally_required:
-                skip_rules = conditionally_required[arg].get("skip_when", {})
+            skip_rules = conditionally_required.get(arg)
+            if skip_rules:
                 should_skip = False
-                for condition_arg, skip_values in skip_rules.items():
-                    current_val = str(tool_args.get(condition_arg, "")).lower().strip()
+                for condition_arg, skip_values in skip_rules:
+                    current_val = norm_cache.get(condition_arg)
+                    if current_val is None:
+                        current_val = norm_cache[condition_arg] = _norm(
+                            tool_args.get(condition_arg, "")
+                        )
                     if current_val in skip_values:
                         should_skip = True
                         break
@@ -220,8 +298,7 @@ class MetaReasoningGate(Extension):
                     continue
 
             # Check if arg is present and non-empty
-            val = tool_args.get(arg)
-            if val is None or (isinstance(val, str) and not val.strip()):
+            if _is_blank(tool_args.get(arg)):
                 missing.append(arg)
 
         return missing
@@ -27,6 +27,16 @@ FALLBACK_MAP = {
     ("any", "execution"): "Execution error. Review error message and adjust.",
 }
 
+# FALLBACK_MAP regrouped as tool -> error_type -> advice: at most three
+# string-keyed probes instead of three tuple builds + tuple-keyed probes
+_FALLBACK_BY_TOOL: dict[str, dict[str, str]] = {}
+for (_tool, _err), _advice in FALLBACK_MAP.items():
+    _FALLBACK_BY_TOOL.setdefault(_tool, {})[_err] = _advice
+_FALLBACK_ANY = _FALLBACK_BY_TOOL.get("any", {})
+
+# Shared read-only fallback for missing dict data — avoids allocating per read
+_EMPTY: dict = {}
+
 STEP_BACK_ADVICE = (
     "Multiple consecutive failures without success. "
     "Consider a different approach or ask the user for guidance."
@@ -43,15 +53,14 @@ class ToolFallbackAdvisor(Extension):
             if not failures:
                 return
 
-            consecutive = failures.get("consecutive", {})
-            history = failures.get("history", [])
+            tool_count = failures.get("consecutive", _EMPTY).get(tool_name, 0)
+            history = failures.get("history", ())
 
             # Check if error comprehension provided specific guidance
             diagnosis = self.agent.get_data("_error_diagnosis")
             if diagnosis and diagnosis.get("confidence", 0) > 0.7 and diagnosis.get("suggested_actions"):
                 # Error comprehension already injected context — don't pile on with generic advice.
                 # Only fire if the fallback threshold is also met (avoiding double-injection on first error).
-                tool_count = failures.get("consecutive", {}).get(tool_name, 0) if failures else 0
                 if tool_count >= TOOL_THRESHOLD:
                     # Diagnosis already injected rich guidance. Log that we deferred.
                     try:
@@ -65,14 +74,9 @@ class ToolFallbackAdvisor(Extension):
 
             advice_parts = []
 
-            tool_count = consecutive.get(tool_name, 0)
             if tool_count >= TOOL_THRESHOLD:
-                recent_error = None
-                for entry in reversed(history):
-                    if entry["tool"] == tool_name:
-                        recent_error = entry["error_type"]
-                        break
-
+                # Logger keeps tool -> latest error_type in step with history
+                recent_error = failures.get("last_error_by_tool", _EMPTY).get(tool_name)
                 if recent_error:
                     advice = self._lookup_fallback(tool_name, recent_error)
                     if advice:
@@ -96,16 +100,9 @@ class ToolFallbackAdvisor(Extension):
             pass
 
     def _lookup_fallback(self, tool_name: str, error_type: str) -> str | None:
-        key = (tool_name, error_type)
-        if key in FALLBACK_MAP:
-            return FALLBACK_MAP[key]
-
-        key = (tool_name, "any")
-        if key in FALLBACK_MAP:
-            return FALLBACK_MAP[key]
-
-        key = ("any", error_type)
-        if key in FALLBACK_MAP:
-            return FALLBACK_MAP[key]
-
-        return None
+        specific = _FALLBACK_BY_TOOL.get(tool_name, _EMPTY)
+        return (
+            specific.get(error_type)
+            or specific.get("any")
+            or _FALLBACK_ANY.get(error_type)
+        )
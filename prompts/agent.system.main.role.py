@@ -11,21 +11,39 @@ class PersonalityLoader(VariablesPlugin):
     PERSONALITIES_DIR = "/a0/usr/personalities"
     FALLBACK_PERSONALITY = ""
 
+    # path -> (st_mtime_ns, persona text); one entry per personality file,
+    # re-rendered only when that file changes
+    _text_cache: dict[str, tuple[int, str]] = {}
+
+    # (directory, st_mtime_ns, sorted personality file names) of the last
+    # listing; a directory's mtime changes whenever entries come or go
+    _listing_cache: tuple[str, int, tuple[str, ...]] | None = None
+
     def get_variables(
         self, file: str, backup_dirs: list[str] | None = None, **kwargs
     ) -> dict[str, Any]:
         try:
-            active = self._get_active_personality()
-            if not active:
+            path = self._get_active_personality_path()
+            if not path:
                 return {"personality": self.FALLBACK_PERSONALITY}
 
-            persona_text = self._extract_prompt_text(active)
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._text_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return {"personality": cached[1]}
+
+            active = self._load_json(path)
+            if not active:
+                persona_text = self.FALLBACK_PERSONALITY
+            else:
+                persona_text = self._extract_prompt_text(active)
+            self._text_cache[path] = (mtime, persona_text)
             return {"personality": persona_text}
         except Exception:
             return {"personality": self.FALLBACK_PERSONALITY}
 
-    def _get_active_personality(self) -> dict | None:
-        """Find and load the active personality JSON."""
+    def _get_active_personality_path(self) -> str | None:
+        """Find the active personality JSON file."""
         personalities_dir = self.PERSONALITIES_DIR
 
         if not os.path.isdir(personalities_dir):
@@ -38,23 +56,36 @@ class PersonalityLoader(VariablesPlugin):
         if selected:
             path = os.path.join(personalities_dir, selected)
             if os.path.isfile(path):
-                return self._load_json(path)
+                return path
 
         # Fallback: look for _active.json
         active_path = os.path.join(personalities_dir, "_active.json")
         if os.path.isfile(active_path):
-            return self._load_json(active_path)
+            return active_path
 
         # Fallback: load first .json file alphabetically
-        files = sorted(
-            f for f in os.listdir(personalities_dir)
-            if f.endswith(".json") and not f.startswith(".")
-        )
+        files = self._list_personality_files(personalities_dir)
         if files:
-            return self._load_json(os.path.join(personalities_dir, files[0]))
+            return os.path.join(personalities_dir, files[0])
 
         return None
 
+    def _list_personality_files(self, directory: str) -> tuple[str, ...]:
+        """Sorted visible .json names in `directory`, re-listed only when the
+        directory's mtime changes."""
+        mtime = os.stat(directory).st_mtime_ns
+        cached = PersonalityLoader._listing_cache
+        if cached is not None and cached[0] == directory and cached[1] == mtime:
+            return cached[2]
+
+        with os.scandir(directory) as entries:
+            files = tuple(sorted(
+                e.name for e in entries
+                if e.name.endswith(".json") and not e.name.startswith(".")
+            ))
+        PersonalityLoader._listing_cache = (directory, mtime, files)
+        return files
+
     def _load_json(self, path: str) -> dict | None:
         try:
             with open(path, "r", encoding="utf-8") as f:
@@ -75,25 +106,26 @@ class PersonalityLoader(VariablesPlugin):
 
         bio = identity.get("bio", {})
         origin = identity.get("origin", {})
-        if origin.get("nationality"):
-            age_str = f", age {bio['age_perceived']}" if bio.get("age_perceived") else ""
-            sections.append(
-                f"Nationality: {origin['nationality']}{age_str}."
-            )
+        nationality = origin.get("nationality")
+        if nationality:
+            age = bio.get("age_perceived")
+            age_str = f", age {age}" if age else ""
+            sections.append(f"Nationality: {nationality}{age_str}.")
 
         # Occupation
         history = data.get("history", {})
-        occupation = history.get("occupation", {})
-        if occupation.get("title"):
-            sections.append(f"Role: {occupation['title']}.")
+        title = history.get("occupation", {}).get("title")
+        if title:
+            sections.append(f"Role: {title}.")
 
         # Core drive
         motivations = data.get("motivations", {})
         core_drive = motivations.get("core_drive", "")
         if core_drive:
             # Truncate to first 200 chars to save tokens
-            drive_text = core_drive.strip()[:200]
-            if len(core_drive.strip()) > 200:
+            core_drive = core_drive.strip()
+            drive_text = core_drive[:200]
+            if len(core_drive) > 200:
                 drive_text += "..."
             sections.append(f"Core drive: {drive_text}")
 
@@ -105,41 +137,42 @@ class PersonalityLoader(VariablesPlugin):
         idiolect = linguistics.get("idiolect", {})
 
         style_parts = []
-        if text_style.get("style_descriptors"):
-            style_parts.append(
-                "Communication style: " + ", ".join(text_style["style_descriptors"])
-            )
-        if text_style.get("formality_level"):
-            level = text_style["formality_level"]
+        descriptors = text_style.get("style_descriptors")
+        if descriptors:
+            style_parts.append("Communication style: " + ", ".join(descriptors))
+        level = text_style.get("formality_level")
+        if level:
             if level > 0.7:
                 style_parts.append("Highly formal register.")
             elif level < 0.3:
                 style_parts.append("Casual register.")
-        if text_style.get("verbosity_level") is not None:
-            v = text_style["verbosity_level"]
+        v = text_style.get("verbosity_level")
+        if v is not None:
             if v < 0.2:
                 style_parts.append("Extremely concise.")
             elif v > 0.7:
                 style_parts.append("Verbose and detailed.")
-        if syntax.get("sentence_structure"):
-            style_parts.append(f"Sentence structure: {syntax['sentence_structure']}.")
-        if interaction.get("emotional_coloring"):
-            style_parts.append(f"Tone: {interaction['emotional_coloring']}.")
+        structure = syntax.get("sentence_structure")
+        if structure:
+            style_parts.append(f"Sentence structure: {structure}.")
+        tone = interaction.get("emotional_coloring")
+        if tone:
+            style_parts.append(f"Tone: {tone}.")
         if style_parts:
             sections.append(" ".join(style_parts))
 
         # Catchphrases
-        if idiolect.get("catchphrases"):
-            phrases = idiolect["catchphrases"][:4]  # Max 4
+        catchphrases = idiolect.get("catchphrases")
+        if catchphrases:
+            phrases = catchphrases[:4]  # Max 4
             sections.append(
                 "Signature phrases: " + " | ".join(f'"{p}"' for p in phrases)
             )
 
         # Forbidden words
-        if idiolect.get("forbidden_words"):
-            sections.append(
-                "Never use these words: " + ", ".join(idiolect["forbidden_words"])
-            )
+        forbidden = idiolect.get("forbidden_words")
+        if forbidden:
+            sections.append("Never use these words: " + ", ".join(forbidden))
 
         # Psychology - light touch, just traits that affect communication
         psychology = data.get("psychology", {})
@@ -156,13 +189,15 @@ class PersonalityLoader(VariablesPlugin):
         interests = data.get("interests", {})
         favorites = interests.get("favorites", {})
         aversions = interests.get("aversions", [])
-        if favorites.get("food") or favorites.get("book"):
-            fav_items = []
-            for key in ["book", "movie", "food"]:
-                if favorites.get(key):
-                    fav_items.append(f"{key}: {favorites[key]}")
-            if fav_items:
-                sections.append("Favorites: " + ", ".join(fav_items))
+        fav_items = []
+        listed = False  # a movie alone does not earn a Favorites line
+        for key in ("book", "movie", "food"):
+            value = favorites.get(key)
+            if value:
+                fav_items.append(f"{key}: {value}")
+                listed = listed or key != "movie"
+        if listed:
+            sections.append("Favorites: " + ", ".join(fav_items))
         if aversions:
             sections.append("Dislikes: " + ", ".join(aversions[:3]))
 
@@ -18,10 +18,12 @@ v3.1 — Compound Classification Layer
 """
 
 import json
+import os
 import re
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from agent import LoopData
 from python.helpers.extension import Extension
@@ -30,6 +32,50 @@ TAXONOMY_PATH          = Path(__file__).parent / "slot_taxonomy.json"
 BELIEF_KEY             = "__bst_belief_state__"
 MAX_HISTORY_SCAN_TURNS = 8
 
+# Slot resolvers that read the history text; a domain with none of them
+# never has the text built
+HISTORY_RESOLVERS = frozenset({
+    "file_extension_inference", "last_mentioned_file",
+    "last_mentioned_path", "history_scan",
+})
+
+# Environment switch — "off" drops the per-turn [BST] info log record (its
+# lines are then never formatted); warnings are always logged
+BST_LOG_ENV = "EXO_BST_LOG"
+_LOG_INFO   = os.environ.get(BST_LOG_ENV, "").strip().lower() != "off"
+
+# Whole messages (lowercased) that skip slot resolution when the taxonomy
+# confirms they can only pass through — see _passthrough_set()
+CONVERSATIONAL_MESSAGES = frozenset({
+    "hi", "hi!", "hello", "hello!", "hey", "hey!", "yo",
+    "thanks", "thanks!", "thank you", "thank you!", "thx", "ty",
+    "ok", "ok.", "okay", "okay.", "cool", "great", "great!", "nice", "nice!",
+    "good morning", "good evening", "bye", "goodbye",
+})
+
+# ── Slot extraction patterns ──────────────────────────────────────────────────
+# Compiled once. Each tuple is tried in order and the first pattern with any
+# match wins (its last match is returned), so they stay separate patterns
+# rather than one alternation — a fused scan would pick a different match.
+_FILE_REF_RX = (
+    re.compile(r'`([^`]+\.[a-zA-Z]{1,5})`'),
+    re.compile(r'"([^"]+\.[a-zA-Z]{1,5})"'),
+    re.compile(r"'([^']+\.[a-zA-Z]{1,5})'"),
+    re.compile(r'(\S+\.[a-zA-Z]{1,5})'),
+)
+_PATH_REF_RX = (
+    re.compile(r'(/[a-zA-Z0-9_\-\.]+(?:/[a-zA-Z0-9_\-\.]+)+)'),
+    re.compile(r'(~/[a-zA-Z0-9_\-\./]+)'),
+)
+_ENTITY_RX = (
+    re.compile(r'`([^`]+)`'),
+    re.compile(r'"([^"]+)"'),
+    re.compile(r"'([^']+)'"),
+)
+
+# history_scan only extracts for slots whose name contains one of these
+_HISTORY_SCAN_SLOT_HINTS = ("file", "path", "source", "target", "script")
+
 # ── Compound classification constants ─────────────────────────────────────────
 SECONDARY_MIN_SIGNALS = 1   # Secondary must match at least 1 signal
 MOMENTUM_THRESHOLD    = 3   # Turns before momentum resists reclassification
@@ -499,17 +545,32 @@ def _generate_enrichment(classification: "CompoundClassification") -> str:
     return "\n".join(parts)
 
 
+# profile path -> (st_mtime_ns, parsed profile) from the last successful load
+_profile_cache: dict[str, tuple[int, dict]] = {}
+
+
 def _load_model_profile(agent) -> dict | None:
-    """Load eval profile for current model. Returns None if not found (permissive default)."""
+    """Load eval profile for current model. Returns None if not found (permissive default).
+
+    Parsed profiles are cached by file mtime and shared — read-only.
+    """
     try:
         config     = getattr(agent, "config", None)
         model_name = getattr(config, "chat_model", "") if config else ""
         if not model_name:
             return None
-        profile_path = Path(f"/a0/usr/profiles/{model_name}.json")
-        if profile_path.exists():
-            with open(profile_path) as f:
-                return json.load(f)
+        profile_path = f"/a0/usr/profiles/{model_name}.json"
+        try:
+            mtime = os.stat(profile_path).st_mtime_ns
+        except OSError:
+            return None
+        hit = _profile_cache.get(profile_path)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+        with open(profile_path) as f:
+            profile = json.load(f)
+        _profile_cache[profile_path] = (mtime, profile)
+        return profile
     except Exception:
         pass
     return None
@@ -521,6 +582,8 @@ class BeliefStateTracker(Extension):
     """Agent-Zero extension: before_main_llm_call"""
 
     async def execute(self, loop_data: LoopData = LoopData(), **kwargs) -> Any:
+        # Info lines for this turn, emitted as one log record at the end
+        info: list[str] = []
         try:
             # Find the last user message (dict format)
             user_msg = _get_last_user_message(loop_data.history_output)
@@ -541,7 +604,11 @@ class BeliefStateTracker(Extension):
             new_primary, new_secondary = _extract_compound(scores)
 
             # Load compound momentum state from agent store
-            bst_store         = getattr(self.agent, "_bst_store", {}) or {}
+            # Shared BST store on the agent (belief state is read from it by
+            # the dispatcher, HTN selector, supervisor and memory hooks)
+            bst_store = getattr(self.agent, "_bst_store", None)
+            if bst_store is None:
+                bst_store = self.agent._bst_store = {}
             current_signature = bst_store.get("_compound_sig", "conversation")
             current_momentum  = bst_store.get("_compound_turns", 0)
 
@@ -583,10 +650,8 @@ class BeliefStateTracker(Extension):
             )
 
             # Persist compound momentum state
-            if not hasattr(self.agent, "_bst_store") or self.agent._bst_store is None:
-                self.agent._bst_store = {}
-            self.agent._bst_store["_compound_sig"]   = final_signature
-            self.agent._bst_store["_compound_turns"] = final_momentum
+            bst_store["_compound_sig"]   = final_signature
+            bst_store["_compound_turns"] = final_momentum
 
             # Write to extras_persistent (backward-compat key + new compound key)
             ep = getattr(loop_data, "extras_persistent", None)
@@ -597,60 +662,52 @@ class BeliefStateTracker(Extension):
             ep["_bst_compound"] = compound_cls.to_dict()
 
             # ── Logging ───────────────────────────────────────────────────────
-            sec_str    = (
-                f" + {final_secondary['domain']} ({final_secondary['confidence']} signal"
-                f"{'s' if final_secondary['confidence'] != 1 else ''})"
-                if final_secondary else ""
-            )
-            enrich_str = (
-                f"primary={'ON' if enrichment_plan['primary_enrichment'] else 'OFF'} "
-                f"secondary={'ON' if enrichment_plan['secondary_enrichment'] else 'OFF'}"
-            )
-            self.agent.context.log.log(
-                type="info",
-                content=(
+            if _LOG_INFO:
+                sec_str    = (
+                    f" + {final_secondary['domain']} ({final_secondary['confidence']} signal"
+                    f"{'s' if final_secondary['confidence'] != 1 else ''})"
+                    if final_secondary else ""
+                )
+                enrich_str = (
+                    f"primary={'ON' if enrichment_plan['primary_enrichment'] else 'OFF'} "
+                    f"secondary={'ON' if enrichment_plan['secondary_enrichment'] else 'OFF'}"
+                )
+                info.append(
                     f"[BST] {final_primary['domain']} ({final_primary['confidence']} signal"
                     f"{'s' if final_primary['confidence'] != 1 else ''})"
                     f"{sec_str} | sig={final_signature} | momentum={final_momentum} "
                     f"| enrichment: {enrich_str}"
-                ),
-            )
+                )
 
-            if momentum_held:
-                self.agent.context.log.log(
-                    type="info",
-                    content=(
+                if momentum_held:
+                    info.append(
                         f"[BST] Momentum held: {current_signature} ({current_momentum} turns) "
                         f"resisted {raw_signature} ({new_primary['confidence']} signal"
                         f"{'s' if new_primary['confidence'] != 1 else ''})"
-                    ),
-                )
-            elif momentum_broke:
-                self.agent.context.log.log(
-                    type="info",
-                    content=(
+                    )
+                elif momentum_broke:
+                    info.append(
                         f"[BST] Momentum break: {current_signature} ({current_momentum} turns) "
                         f"→ {final_signature} ({final_primary['confidence']} signal"
                         f"{'s' if final_primary['confidence'] != 1 else ''}, not in compound)"
-                    ),
-                )
+                    )
 
-            if enrichment_plan.get("reason_secondary_skipped") == "disabled_in_profile":
-                config     = getattr(self.agent, "config", None)
-                model_name = getattr(config, "chat_model", "") if config else ""
-                self.agent.context.log.log(
-                    type="info",
-                    content=(
+                if enrichment_plan.get("reason_secondary_skipped") == "disabled_in_profile":
+                    config     = getattr(self.agent, "config", None)
+                    model_name = getattr(config, "chat_model", "") if config else ""
+                    info.append(
                         f"[BST] Secondary enrichment skipped for "
                         f"{compound_cls.secondary_domain}: disabled_in_profile ({model_name})"
-                    ),
-                )
+                    )
 
             # Generate compound enrichment text
             compound_enrichment = _generate_enrichment(compound_cls)
 
             # ── Slot resolution (unchanged) ───────────────────────────────────
-            tracker = _BSTEngine(self.agent)
+            # Runs inline on the event loop: a warm process() is a few tens of
+            # µs of CPU, less than an asyncio.to_thread hop costs, and it
+            # mutates agent state this same turn reads back afterwards
+            tracker = _BSTEngine(self.agent, bst_store)
             result  = tracker.process(message)
 
             # ── Apply enrichment ──────────────────────────────────────────────
@@ -660,10 +717,8 @@ class BeliefStateTracker(Extension):
                     compound_enrichment + "\n\n" + slot_message
                     if compound_enrichment else slot_message
                 )
-                self.agent.context.log.log(
-                    type="info",
-                    content=f"[BST] Slots: {result['filled_slots']}",
-                )
+                if _LOG_INFO:
+                    info.append(f"[BST] Slots: {result['filled_slots']}")
 
             elif result["action"] == "clarify":
                 user_msg['content'] = (
@@ -672,16 +727,19 @@ class BeliefStateTracker(Extension):
                     f"Ask user: \"{result['question']}\"\n"
                     f"Wait for answer before proceeding."
                 )
-                self.agent.context.log.log(
-                    type="info",
-                    content=f"[BST] Clarifying - Domain: {result['domain']} | Missing: {result['missing_slot']}",
-                )
+                if _LOG_INFO:
+                    info.append(
+                        f"[BST] Clarifying - Domain: {result['domain']} | Missing: {result['missing_slot']}"
+                    )
 
             elif compound_enrichment:
                 # Slot resolver returned passthrough but compound has enrichment
                 user_msg['content'] = compound_enrichment + "\n\n[USER MESSAGE]\n" + message
 
+            self._log_info(info)
+
         except Exception as e:
+            self._log_info(info)
             try:
                 self.agent.context.log.log(
                     type="warning",
@@ -690,6 +748,16 @@ class BeliefStateTracker(Extension):
             except Exception:
                 pass
 
+    def _log_info(self, lines: list[str]) -> None:
+        """Emit the turn's buffered info lines as a single log record."""
+        if not lines:
+            return
+        try:
+            self.agent.context.log.log(type="info", content="\n".join(lines))
+        except Exception:
+            pass
+        lines.clear()
+
 
 # ── Message extraction ────────────────────────────────────────────────────────
 
@@ -698,7 +766,10 @@ def _get_last_user_message(history_output: list):
     if not history_output:
         return None
 
-    for msg in reversed(history_output):
+    # Index walk from the end: the user turn is almost always within the
+    # last one or two entries
+    for i in range(len(history_output) - 1, -1, -1):
+        msg = history_output[i]
         if not isinstance(msg, dict):
             continue
 
@@ -723,34 +794,200 @@ def _get_last_user_message(history_output: list):
     return None
 
 
+def _flatten_content(content) -> str:
+    """Message content as text; multi-part (list) content is joined once."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            p.get("text", "") if isinstance(p, dict) else str(p)
+            for p in content
+        )
+    return str(content)
+
+
+def _last_match(patterns: tuple, text: str) -> str | None:
+    """Last match of the first pattern in `patterns` that matches at all."""
+    for rx in patterns:
+        matches = rx.findall(text)
+        if matches:
+            return matches[-1]
+    return None
+
+
+def _slot_lines(pairs) -> str:
+    """Indented "name: value" lines for filled slots, plus the block separator."""
+    return "\n".join([f"  {k}: {v}" for k, v in pairs]) + "\n\n"
+
+
+_MISS = object()  # resolver sentinel: no value, try the next resolver
+
+TRIGGER_GRAM = 3  # trigger index key: the trigger's first N characters
+
+# Messages longer than this many characters per index key (pasted logs,
+# code) test every trigger directly: building their gram set costs more
+# than the scan it saves (measured crossover ~12x on the shipped taxonomy)
+TRIGGER_SCAN_FACTOR = 12
+
+
+class _TriggerTable(NamedTuple):
+    """Domain triggers indexed for _classify; entries are
+    (domain index, trigger, counts, words).
+
+    `counts` is 1 when the trigger meets min_trigger_word_length (it adds to
+    the hit count); every present trigger adds its word count to the weight.
+    """
+    domains:   tuple            # domain names, taxonomy order
+    by_prefix: dict             # first TRIGGER_GRAM chars -> [entry, ...]
+    short:     tuple            # entries for triggers shorter than TRIGGER_GRAM
+    every:     tuple            # all entries, for the direct scan
+
+
+def _trigger_table(taxonomy: dict) -> _TriggerTable:
+    min_len   = taxonomy.get("global", {}).get("min_trigger_word_length", 3)
+    domains   = []
+    by_prefix = {}
+    short     = []
+    for domain_name, domain in taxonomy["domains"].items():
+        if domain_name == "conversational":
+            continue
+        for t in domain.get("triggers", []):
+            entry = (len(domains), t, int(len(t) >= min_len), len(t.split()))
+            if len(t) < TRIGGER_GRAM:
+                short.append(entry)
+            else:
+                by_prefix.setdefault(t[:TRIGGER_GRAM], []).append(entry)
+        domains.append(domain_name)
+    every = tuple(chain(short, *by_prefix.values()))
+    return _TriggerTable(tuple(domains), by_prefix, tuple(short), every)
+
+
+@dataclass(slots=True, frozen=True)
+class _SlotDef:
+    """One taxonomy slot_definitions entry, flattened at load; read-only."""
+    resolvers:     tuple
+    resolve_fns:   tuple        # _BSTEngine.RESOLVERS entries, chain order
+    keyword_map:   dict
+    default:       Any
+    nullable:      bool
+    required_when: dict | None
+    type:          str | None
+    enum_values:   tuple
+    question:      str | None   # clarification asked when the slot is missing
+
+
+class _SlotPlan(NamedTuple):
+    """A domain's slots in resolution order; entries are (name, _SlotDef)."""
+    required:      tuple
+    optional:      tuple
+    defs:          dict         # slot name -> _SlotDef
+    needs_history: bool         # a bound resolver is one of HISTORY_RESOLVERS
+    instruction:   str          # "[INSTRUCTION]" block + separator, or ""
+
+
+def _slot_def(slot_name: str, sd: dict) -> _SlotDef:
+    resolvers   = tuple(sd.get("resolvers") or ())
+    keyword_map = sd.get("keyword_map") or {}
+    table       = _BSTEngine.RESOLVERS
+    return _SlotDef(
+        resolvers=resolvers,
+        # Resolvers that can never produce a value for this slot are left
+        # out: keyword_map without keywords, history_scan on a slot whose
+        # name has no file/path hint
+        resolve_fns=tuple(
+            table[r] for r in resolvers
+            if r in table
+            and (r != "keyword_map" or keyword_map)
+            and (r != "history_scan"
+                 or any(k in slot_name for k in _HISTORY_SCAN_SLOT_HINTS))
+        ),
+        keyword_map=keyword_map,
+        default=sd.get("default"),
+        nullable=sd.get("nullable", True),
+        required_when=sd.get("required_when"),
+        type=sd.get("type"),
+        enum_values=tuple(sd.get("enum_values") or ()),
+        question=sd.get("question", f"What is the {slot_name.replace('_', ' ')}?"),
+    )
+
+
+def _substring_rx(needles) -> re.Pattern | None:
+    """One alternation that matches wherever any of `needles` occurs as a
+    plain substring (no word boundaries); None when there are no needles."""
+    needles = list(needles)
+    if not needles:
+        return None
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+def _slot_plans(taxonomy: dict) -> dict[str, _SlotPlan]:
+    history_fns = {_BSTEngine.RESOLVERS[r] for r in HISTORY_RESOLVERS}
+    plans = {}
+    for domain_name, domain in taxonomy["domains"].items():
+        raw  = domain.get("slot_definitions", {})
+        defs = {}
+        for slot_name in chain(domain.get("required_slots", []),
+                               domain.get("optional_slots", [])):
+            if slot_name not in defs:
+                defs[slot_name] = _slot_def(slot_name, raw.get(slot_name, {}))
+        plans[domain_name] = _SlotPlan(
+            required=tuple((n, defs[n]) for n in domain.get("required_slots", [])),
+            optional=tuple((n, defs[n]) for n in domain.get("optional_slots", [])),
+            defs=defs,
+            needs_history=any(
+                fn in history_fns for d in defs.values() for fn in d.resolve_fns
+            ),
+            instruction=(
+                f"[INSTRUCTION]\n{domain['preamble']}\n\n"
+                if domain.get("preamble") else ""
+            ),
+        )
+    return plans
+
+
 # ── Slot resolution engine (unchanged from v3) ────────────────────────────────
 
 class _BSTEngine:
     """Core belief state tracking logic."""
 
-    def __init__(self, agent):
+    def __init__(self, agent, store: dict):
         self.agent    = agent
-        self.taxonomy = self._load_taxonomy()
-        self.globs    = self.taxonomy.get("global", {})
+        self.store    = store  # agent._bst_store, holds BELIEF_KEY
+        # Everything taxonomy-derived comes from the module-level cache,
+        # so a per-turn engine costs one stat() of the taxonomy file
+        self.index    = _load_taxonomy()
+        self.taxonomy = self.index.data
+        self.globs    = self.index.globs
 
     def process(self, message: str) -> dict:
         """Main entry point — classify and resolve slots."""
 
+        # Lowercased once; every matcher below works on this copy
+        msg_lower = message.lower()
+
+        # Bare greetings / acknowledgements: verified at taxonomy load to be
+        # neither underspecified nor trigger-bearing, so always passthrough
+        if msg_lower in self.index.passthrough:
+            self._clear_belief()
+            return {"action": "passthrough", "domain": "conversational"}
+
         # Check for underspecified follow-up
-        if self._is_underspecified(message):
+        if self._is_underspecified(msg_lower):
             belief = self._get_persisted_belief()
             if belief:
                 return self._handle_underspecified(message, belief)
 
         # Classify domain
-        domain_name, confidence = self._classify(message)
+        domain_name, confidence = self._classify(msg_lower)
 
         if domain_name == "conversational" or not domain_name:
             self._clear_belief()
             return {"action": "passthrough", "domain": "conversational"}
 
         domain  = self.taxonomy["domains"][domain_name]
-        history = self._get_history_text()
+        plan    = self.index.slot_plans[domain_name]
+        history = self._get_history_text() if plan.needs_history else ""
+        recent  = message + " " + history[:500]  # last_mentioned_* scan text
 
         belief = {
             "domain":           domain_name,
@@ -761,26 +998,28 @@ class _BSTEngine:
         }
 
         # Resolve required slots
-        for slot_name in domain.get("required_slots", []):
-            slot_def = domain["slot_definitions"].get(slot_name, {})
-            value    = self._resolve_slot(slot_name, slot_def, message, history)
+        for slot_name, slot_def in plan.required:
+            value = self._resolve_slot(
+                slot_name, slot_def, message, msg_lower, history, recent
+            )
 
             if value is None and not self._is_conditionally_required(slot_name, slot_def, belief["slots"]):
                 continue
 
             belief["slots"][slot_name] = value
-            if value is None and not slot_def.get("nullable", True):
+            if value is None and not slot_def.nullable:
                 belief["missing_required"].append(slot_name)
 
         # Resolve optional slots
-        for slot_name in domain.get("optional_slots", []):
-            slot_def = domain["slot_definitions"].get(slot_name, {})
-            value    = self._resolve_slot(slot_name, slot_def, message, history)
+        for slot_name, slot_def in plan.optional:
+            value = self._resolve_slot(
+                slot_name, slot_def, message, msg_lower, history, recent
+            )
             if value is not None:
                 belief["slots"][slot_name] = value
 
         # Recompute confidence from slot fill rate
-        required_count = len(domain.get("required_slots", []))
+        required_count = len(plan.required)
         if required_count > 0:
             filled    = required_count - len(belief["missing_required"])
             slot_conf = filled / required_count
@@ -798,8 +1037,7 @@ class _BSTEngine:
             max_q = self.globs.get("max_clarification_questions", 2)
             if asked < max_q:
                 missing_slot = belief["missing_required"][0]
-                slot_def     = domain["slot_definitions"].get(missing_slot, {})
-                question     = slot_def.get("question", f"What is the {missing_slot.replace('_', ' ')}?")
+                question     = plan.defs[missing_slot].question
 
                 if question:
                     belief["clarifications_asked"] = asked + 1
@@ -818,85 +1056,116 @@ class _BSTEngine:
             "domain":           domain_name,
             "confidence":       belief["confidence"],
             "filled_slots":     [k for k, v in belief["slots"].items() if v is not None],
-            "enriched_message": self._enrich_message(message, domain, belief),
+            "enriched_message": self._enrich_message(message, plan, belief),
         }
 
-    def _classify(self, message: str) -> tuple:
-        """Classify message into taxonomy domain."""
-        msg_lower = message.lower()
-        min_len   = self.globs.get("min_trigger_word_length", 3)
-        scores    = {}
-
-        for domain_name, domain in self.taxonomy["domains"].items():
-            if domain_name == "conversational":
-                continue
-            triggers = domain.get("triggers", [])
-            hits     = sum(1 for t in triggers if len(t) >= min_len and t in msg_lower)
-            if hits > 0:
-                weight = sum(len(t.split()) for t in triggers if t in msg_lower)
-                scores[domain_name] = hits + (weight * 0.1)
-
-        if not scores:
+    def _classify(self, msg_lower: str) -> tuple:
+        """Classify (lowercased) message into taxonomy domain."""
+        table  = self.index.triggers
+        hits   = [0] * len(table.domains)
+        weight = [0] * len(table.domains)
+
+        # Only triggers whose opening characters occur somewhere in the
+        # message can be substrings of it; each is then confirmed once.
+        # Long messages skip the gram set and test every trigger instead.
+        by_prefix = table.by_prefix
+        if len(msg_lower) > TRIGGER_SCAN_FACTOR * len(by_prefix):
+            groups = (table.every,)
+        else:
+            grams = {
+                msg_lower[i:i + TRIGGER_GRAM]
+                for i in range(len(msg_lower) - TRIGGER_GRAM + 1)
+            }
+            groups = chain(
+                (table.short,),
+                (by_prefix[g] for g in grams.intersection(by_prefix)),
+            )
+        for entries in groups:
+            for d, trigger, counts, words in entries:
+                if trigger in msg_lower:
+                    weight[d] += words
+                    hits[d]   += counts
+
+        # One pass in taxonomy order; strict > keeps the first domain on ties
+        best, raw_max = None, 0.0
+        for d, name in enumerate(table.domains):
+            if hits[d] > 0:
+                score = hits[d] + (weight[d] * 0.1)
+                if best is None or score > raw_max:
+                    best, raw_max = name, score
+
+        if best is None:
             return "conversational", 1.0
 
-        best       = max(scores, key=lambda k: scores[k])
-        raw_max    = max(scores.values())
         confidence = min(1.0, raw_max / max(3.0, raw_max + 1))
         return best, confidence
 
-    def _resolve_slot(self, slot_name: str, slot_def: dict, message: str, history: str) -> Any:
-        """Resolve slot value using resolver chain."""
-        resolvers   = slot_def.get("resolvers", [])
-        keyword_map = slot_def.get("keyword_map", {})
-        msg_lower   = message.lower()
-
-        for resolver in resolvers:
-            if resolver == "keyword_map" and keyword_map:
-                for keyword, mapped in keyword_map.items():
-                    if keyword in msg_lower:
-                        return mapped
-
-            elif resolver == "file_extension_inference":
-                ext_map  = self.globs.get("file_extensions", {})
-                combined = message + " " + history
-                for ext, lang in ext_map.items():
-                    if ext in combined:
-                        return lang
-
-            elif resolver == "last_mentioned_file":
-                ref = self._extract_file_ref(message + " " + history[:500])
-                if ref:
-                    return ref
-
-            elif resolver == "last_mentioned_path":
-                ref = self._extract_path_ref(message + " " + history[:500])
-                if ref:
-                    return ref
-
-            elif resolver == "last_mentioned_entity":
-                entity = self._extract_entity(message)
-                if entity:
-                    return entity
-
-            elif resolver == "history_scan":
-                hit = self._scan_history_for_slot(slot_name, history)
-                if hit:
-                    return hit
-
-            elif resolver == "context_inference":
-                value = self._inline_context_resolve(slot_name, slot_def, message)
-                if value:
-                    return value
-
-            elif resolver == "working_memory_lookup":
-                hit = self._working_memory_lookup(slot_name, message)
-                if hit:
-                    return hit
-
-        return slot_def.get("default")
-
-    def _is_conditionally_required(self, slot_name: str, slot_def: dict, current_slots: dict) -> bool:
-        rw = slot_def.get("required_when")
+    def _resolve_slot(self, slot_name: str, slot_def: _SlotDef, message: str,
+                      msg_lower: str, history: str, recent: str) -> Any:
+        """Resolve slot value using resolver chain.
+
+        `recent` is message + " " + history[:500], built once per process().
+        The chain is slot_def.resolve_fns, bound from RESOLVERS at load.
+        """
+        for resolve in slot_def.resolve_fns:
+            value = resolve(self, slot_name, slot_def, message, msg_lower, history, recent)
+            if value is not _MISS:
+                return value
+        return slot_def.default
+
+    # ── Resolvers: value, or _MISS to fall through to the next one ──────────
+
+    def _r_keyword_map(self, slot_name, slot_def, message, msg_lower, history, recent):
+        for keyword, mapped in slot_def.keyword_map.items():
+            if keyword in msg_lower:
+                return mapped
+        return _MISS
+
+    def _r_file_extension_inference(self, slot_name, slot_def, message, msg_lower, history, recent):
+        # Text holding none of the extensions' first characters (all "."
+        # today) cannot contain any of them
+        index = self.index
+        if not any(c in message or c in history for c in index.ext_leads):
+            return _MISS
+        # Extensions hold no spaces, so they cannot straddle the
+        # join — test both pieces instead of concatenating them
+        for ext, lang in index.extensions:
+            if ext in message or ext in history:
+                return lang
+        return _MISS
+
+    def _r_last_mentioned_file(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._extract_file_ref(recent) or _MISS
+
+    def _r_last_mentioned_path(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._extract_path_ref(recent) or _MISS
+
+    def _r_last_mentioned_entity(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._extract_entity(message) or _MISS
+
+    def _r_history_scan(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._scan_history_for_slot(slot_name, history) or _MISS
+
+    def _r_context_inference(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._inline_context_resolve(slot_name, slot_def, msg_lower) or _MISS
+
+    def _r_working_memory_lookup(self, slot_name, slot_def, message, msg_lower, history, recent):
+        return self._working_memory_lookup(slot_name, message) or _MISS
+
+    # Taxonomy resolver name -> unbound resolver; unknown names are skipped
+    RESOLVERS = {
+        "keyword_map":              _r_keyword_map,
+        "file_extension_inference": _r_file_extension_inference,
+        "last_mentioned_file":      _r_last_mentioned_file,
+        "last_mentioned_path":      _r_last_mentioned_path,
+        "last_mentioned_entity":    _r_last_mentioned_entity,
+        "history_scan":             _r_history_scan,
+        "context_inference":        _r_context_inference,
+        "working_memory_lookup":    _r_working_memory_lookup,
+    }
+
+    def _is_conditionally_required(self, slot_name: str, slot_def: _SlotDef, current_slots: dict) -> bool:
+        rw = slot_def.required_when
         if not rw:
             return False
         for key, values in rw.items():
@@ -908,94 +1177,69 @@ class _BSTEngine:
                     return True
         return False
 
-    def _enrich_message(self, original: str, domain: dict, belief: dict) -> str:
-        lines  = []
-        filled = {k: v for k, v in belief["slots"].items() if v is not None}
-        if filled:
-            slot_lines = "\n".join(f"  {k}: {v}" for k, v in filled.items())
-            lines.append(f"[TASK CONTEXT]\n{slot_lines}")
-        preamble = domain.get("preamble")
-        if preamble:
-            lines.append(f"[INSTRUCTION]\n{preamble}")
-        lines.append(f"[USER MESSAGE]\n{original}")
-        return "\n\n".join(lines)
-
-    def _is_underspecified(self, message: str) -> bool:
-        msg_lower = message.lower().strip()
-        pronouns  = self.globs.get("ambiguous_pronouns", [])
-        phrases   = self.globs.get("underspec_phrases", [])
-        words     = msg_lower.split()
-        if len(words) <= 5 and any(p in msg_lower for p in pronouns):
+    def _enrich_message(self, original: str, plan: _SlotPlan, belief: dict) -> str:
+        # Blocks are concatenated in one go; each optional block carries its
+        # own trailing blank-line separator
+        filled  = [(k, v) for k, v in belief["slots"].items() if v is not None]
+        context = "[TASK CONTEXT]\n" + _slot_lines(filled) if filled else ""
+        return f"{context}{plan.instruction}[USER MESSAGE]\n{original}"
+
+    def _is_underspecified(self, msg_lower: str) -> bool:
+        msg_lower = msg_lower.strip()
+        pronoun_rx, phrase_rx = self.index.underspec_rx
+        # maxsplit=5: a sixth element already means "more than five words",
+        # so long messages are not split in full just to be counted
+        if (pronoun_rx is not None and len(msg_lower.split(None, 5)) <= 5
+                and pronoun_rx.search(msg_lower)):
             return True
-        return any(ph in msg_lower for ph in phrases)
+        return phrase_rx is not None and phrase_rx.search(msg_lower) is not None
 
     def _handle_underspecified(self, message: str, belief: dict) -> dict:
         domain_name = belief.get("domain", "conversational")
         if domain_name not in self.taxonomy["domains"]:
             return {"action": "passthrough", "domain": "conversational"}
 
-        domain   = self.taxonomy["domains"][domain_name]
-        preamble = domain.get("preamble", "")
-        filled   = {k: v for k, v in belief.get("slots", {}).items() if v is not None}
+        filled = {k: v for k, v in belief.get("slots", {}).items() if v is not None}
 
-        lines = [f"[CONTINUING TASK — Domain: {domain_name}]"]
-        if filled:
-            lines.append("[PRIOR CONTEXT]\n" + "\n".join(f"  {k}: {v}" for k, v in filled.items()))
-        if preamble:
-            lines.append(f"[INSTRUCTION]\n{preamble}")
-        lines.append(f"[USER MESSAGE]\n{message}")
+        prior = "[PRIOR CONTEXT]\n" + _slot_lines(filled.items()) if filled else ""
+        instruction = self.index.slot_plans[domain_name].instruction
 
         return {
             "action":           "enrich",
             "domain":           domain_name,
             "confidence":       belief.get("confidence", 0.7),
             "filled_slots":     list(filled.keys()),
-            "enriched_message": "\n\n".join(lines),
+            "enriched_message": (
+                f"[CONTINUING TASK — Domain: {domain_name}]\n\n"
+                f"{prior}{instruction}[USER MESSAGE]\n{message}"
+            ),
         }
 
     def _persist_belief(self, belief: dict) -> None:
-        try:
-            if not hasattr(self.agent, "_bst_store"):
-                self.agent._bst_store = {}
-            self.agent._bst_store[BELIEF_KEY] = belief
-        except Exception:
-            pass
+        self.store[BELIEF_KEY] = belief
 
     def _get_persisted_belief(self) -> dict | None:
-        try:
-            store  = getattr(self.agent, "_bst_store", {})
-            belief = store.get(BELIEF_KEY)
-            if not belief:
-                return None
-            ttl = self.globs.get("belief_state_ttl_turns", 6)
-            if self._current_turn() - belief.get("turn", 0) > ttl:
-                self._clear_belief()
-                return None
-            return belief
-        except Exception:
+        belief = self.store.get(BELIEF_KEY)
+        if not belief:
             return None
+        # Only _persist_belief writes BELIEF_KEY, and _current_turn() guards
+        # itself, so no handler is needed here
+        ttl = self.globs.get("belief_state_ttl_turns", 6)
+        if self._current_turn() - belief.get("turn", 0) > ttl:
+            self._clear_belief()
+            return None
+        return belief
 
     def _clear_belief(self) -> None:
-        try:
-            store = getattr(self.agent, "_bst_store", {})
-            store.pop(BELIEF_KEY, None)
-        except Exception:
-            pass
+        self.store.pop(BELIEF_KEY, None)
 
     def _get_history_text(self) -> str:
         try:
-            msgs   = self.agent.history or []
-            recent = msgs[-MAX_HISTORY_SCAN_TURNS:]
-            parts  = []
-            for m in recent:
-                content = getattr(m, "content", "") or ""
-                if isinstance(content, list):
-                    content = " ".join(
-                        p.get("text", "") if isinstance(p, dict) else str(p)
-                        for p in content
-                    )
-                parts.append(str(content))
-            return " ".join(parts)
+            msgs = self.agent.history or []
+            return " ".join(
+                _flatten_content(getattr(m, "content", "") or "")
+                for m in msgs[-MAX_HISTORY_SCAN_TURNS:]
+            )
         except Exception:
             return ""
 
@@ -1006,57 +1250,33 @@ class _BSTEngine:
             return 0
 
     def _extract_file_ref(self, text: str) -> str | None:
-        patterns = [
-            r'`([^`]+\.[a-zA-Z]{1,5})`',
-            r'"([^"]+\.[a-zA-Z]{1,5})"',
-            r"'([^']+\.[a-zA-Z]{1,5})'",
-            r'(\S+\.[a-zA-Z]{1,5})',
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[-1]
-        return None
+        return _last_match(_FILE_REF_RX, text)
 
     def _extract_path_ref(self, text: str) -> str | None:
-        patterns = [
-            r'(/[a-zA-Z0-9_\-\.]+(?:/[a-zA-Z0-9_\-\.]+)+)',
-            r'(~/[a-zA-Z0-9_\-\./]+)',
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[-1]
-        return None
+        return _last_match(_PATH_REF_RX, text)
 
     def _extract_entity(self, text: str) -> str | None:
-        for pattern in [r'`([^`]+)`', r'"([^"]+)"', r"'([^']+)'"]:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[-1]
-        return None
+        return _last_match(_ENTITY_RX, text)
 
     def _scan_history_for_slot(self, slot_name: str, history: str) -> str | None:
-        if any(k in slot_name for k in ["file", "path", "source", "target", "script"]):
+        if any(k in slot_name for k in _HISTORY_SCAN_SLOT_HINTS):
             return self._extract_file_ref(history) or self._extract_path_ref(history)
         return None
 
-    def _inline_context_resolve(self, slot_name: str, slot_def: dict, message: str) -> Any:
-        msg_lower = message.lower()
-
+    def _inline_context_resolve(self, slot_name: str, slot_def: _SlotDef, msg_lower: str) -> Any:
         if slot_name == "language":
-            for ext, lang in self.globs.get("file_extensions", {}).items():
+            for lang in self.index.languages:
                 if lang in msg_lower:
                     return lang
 
-        if slot_def.get("type") == "bool":
+        if slot_def.type == "bool":
             if any(w in msg_lower for w in ["no", "don't", "do not", "ignore", "skip", "without"]):
                 return False
             if any(w in msg_lower for w in ["yes", "always", "keep", "preserve", "maintain"]):
                 return True
 
-        if slot_def.get("type") == "enum":
-            for val in slot_def.get("enum_values", []):
+        if slot_def.type == "enum":
+            for val in slot_def.enum_values:
                 if val in msg_lower:
                     return val
 
@@ -1068,6 +1288,11 @@ class _BSTEngine:
         Search order:
         1. Promoted entities (3+ mentions, most valuable) — most recent first
         2. Active entities — most recent first (sorted by turn descending)
+
+        Records are the slotted dataclasses from _11_working_memory.py:
+        wm["promoted"] maps value -> PromotedEntity (read: `type`,
+        `last_turn`); wm["entities"] holds Entity (read: `type`, `turn`,
+        `value`).
         """
         try:
             wm = getattr(self.agent, "_working_memory", None)
@@ -1100,8 +1325,8 @@ class _BSTEngine:
                 best_val  = None
                 best_turn = -1
                 for value, info in promoted.items():
-                    if info.get("type") in etypes_set and info.get("last_turn", 0) > best_turn:
-                        best_turn = info["last_turn"]
+                    if info.type in etypes_set and info.last_turn > best_turn:
+                        best_turn = info.last_turn
                         best_val  = value
                 if best_val is not None:
                     return best_val
@@ -1109,18 +1334,75 @@ class _BSTEngine:
             # 2. Search active entities, most recent first
             entities = wm.get("entities", [])
             if entities:
-                candidates = [e for e in entities if e.get("type") in etypes_set]
+                candidates = [e for e in entities if e.type in etypes_set]
                 if candidates:
-                    candidates.sort(key=lambda e: e.get("turn", 0), reverse=True)
-                    return candidates[0].get("value")
+                    return max(candidates, key=lambda e: e.turn).value
 
         except Exception:
             pass
         return None
 
-    @staticmethod
-    def _load_taxonomy() -> dict:
-        if not TAXONOMY_PATH.exists():
-            raise FileNotFoundError(f"[BST] slot_taxonomy.json not found at {TAXONOMY_PATH}")
+
+# ── Taxonomy loading ──────────────────────────────────────────────────────────
+
+class _Taxonomy(NamedTuple):
+    """slot_taxonomy.json plus the lookup structures derived from it."""
+    data:         dict
+    globs:        dict          # data["global"], or {} when absent
+    triggers:     _TriggerTable
+    passthrough:  frozenset
+    slot_plans:   dict          # domain name -> _SlotPlan
+    underspec_rx: tuple         # (ambiguous pronoun regex, underspec phrase regex)
+    extensions:   tuple         # file_extensions (ext, language) items, taxonomy order
+    ext_leads:    frozenset     # first character of every extension
+    languages:    tuple         # distinct file_extensions languages, first-seen order
+
+
+# (st_mtime_ns, _Taxonomy) from the last load
+_taxonomy_cache: tuple[int, _Taxonomy] | None = None
+
+
+def _load_taxonomy() -> _Taxonomy:
+    """Return the loaded taxonomy, re-reading the file only when its mtime
+    changes. Everything in it is shared and must not be mutated."""
+    global _taxonomy_cache
+    try:
+        mtime = TAXONOMY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"[BST] slot_taxonomy.json not found at {TAXONOMY_PATH}"
+        ) from None
+    if _taxonomy_cache is None or _taxonomy_cache[0] != mtime:
         with open(TAXONOMY_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+            taxonomy = json.load(f)
+        triggers   = _trigger_table(taxonomy)
+        globs      = taxonomy.get("global", {})
+        extensions = tuple(globs.get("file_extensions", {}).items())
+        _taxonomy_cache = (mtime, _Taxonomy(
+            data=taxonomy,
+            globs=globs,
+            triggers=triggers,
+            passthrough=_passthrough_set(taxonomy, triggers),
+            slot_plans=_slot_plans(taxonomy),
+            underspec_rx=(
+                _substring_rx(globs.get("ambiguous_pronouns", [])),
+                _substring_rx(globs.get("underspec_phrases", [])),
+            ),
+            extensions=extensions,
+            ext_leads=frozenset(ext[:1] for ext, _ in extensions),
+            languages=tuple(dict.fromkeys(lang for _, lang in extensions)),
+        ))
+    return _taxonomy_cache[1]
+
+
+def _passthrough_set(taxonomy: dict, triggers: _TriggerTable) -> frozenset:
+    """CONVERSATIONAL_MESSAGES that process() would pass through anyway: no
+    counted trigger, ambiguous pronoun or underspec phrase occurs in them."""
+    globs  = taxonomy.get("global", {})
+    probes = [t for _, t, counts, _ in triggers.every if counts]
+    probes += globs.get("ambiguous_pronouns", [])
+    probes += globs.get("underspec_phrases", [])
+    return frozenset(
+        m for m in CONVERSATIONAL_MESSAGES
+        if not any(p in m for p in probes)
+    )